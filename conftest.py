@@ -1,6 +1,6 @@
-# conftest.py
-import sys
-from pathlib import Path
-
-# Add the root folder (SentinelPy_clean) to PYTHONPATH
-sys.path.append(str(Path(__file__).parent.resolve()))
+# conftest.py
+import sys
+from pathlib import Path
+
+# Add the root folder (SentinelPy_clean) to PYTHONPATH
+sys.path.append(str(Path(__file__).parent.resolve()))
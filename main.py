@@ -1,4 +1,4 @@
-from scanner.cli.cli import run_cli
-
-if __name__ == "__main__":
-    run_cli()
+from scanner.cli.cli import run_cli
+
+if __name__ == "__main__":
+    run_cli()
@@ -1,29 +1,53 @@
-from .core.tcp import TCPScanner
-from .exceptions import HostResolutionError, PortRangeError, PortScannerError
-
-
-def scan_ports(host: str, ports_range: str, timeout: float = 0.5) -> dict:
-    """
-    Convenience function to scan ports on a host.
-
-    Args:
-        host (str): Target IP address or domain name.
-        ports_range (str): Port range in the format 'start-end' (e.g., '20-80').
-        timeout (float): Timeout in seconds for each port connection attempt.
-
-    Returns:
-        dict: Dictionary containing:
-            - 'open_ports': List of open port numbers
-            - 'scan_results': List of dictionaries with detailed port information
-    """
-    scanner = TCPScanner(timeout=timeout)
-    return scanner.scan(host, ports_range)
-
-
-__all__ = [
-    "scan_ports",
-    "TCPScanner",
-    "PortScannerError",
-    "PortRangeError",
-    "HostResolutionError",
-]
+from typing import TYPE_CHECKING
+
+from .exceptions import (
+    HostResolutionError,
+    HostUnreachableError,
+    PortRangeError,
+    PortScannerError,
+)
+from .utils.validators import PortsSpec
+
+if TYPE_CHECKING:
+    from .core.tcp import TCPScanner
+
+
+def __getattr__(name: str):
+    # Load the scanner (and its asyncio/tqdm imports) on first use only,
+    # so `import scanner` stays cheap for callers that need the exceptions.
+    if name == "TCPScanner":
+        from .core.tcp import TCPScanner
+
+        return TCPScanner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def scan_ports(host: str, ports_range: PortsSpec, timeout: float = 0.5) -> dict:
+    """
+    Convenience function to scan ports on a host.
+
+    Args:
+        host (str): Target IP address or domain name.
+        ports_range (PortsSpec): Port range in the format 'start-end' (e.g., '20-80'),
+            a range, or an iterable of individual ports.
+        timeout (float): Timeout in seconds for each port connection attempt.
+
+    Returns:
+        dict: Dictionary containing:
+            - 'open_ports': List of open port numbers
+            - 'scan_results': List of dictionaries with detailed port information
+    """
+    from .core.tcp import TCPScanner
+
+    scanner = TCPScanner(timeout=timeout)
+    return scanner.scan(host, ports_range)
+
+
+__all__ = [
+    "scan_ports",
+    "TCPScanner",
+    "PortScannerError",
+    "PortRangeError",
+    "HostResolutionError",
+    "HostUnreachableError",
+]
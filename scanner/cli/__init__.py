@@ -1,3 +1,3 @@
-from scanner.cli.cli import run_cli
-
-__all__ = ["run_cli"]
+from scanner.cli.cli import run_cli
+
+__all__ = ["run_cli"]
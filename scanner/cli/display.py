@@ -1,79 +1,95 @@
-import json
-import logging
-from typing import Any, Dict
-
-from scanner.logging import log_with_context
-from scanner.utils.exporter import export_to_json
-
-
-def display_results(results: Dict[str, Any]) -> None:
-    logger = logging.getLogger("sentinelpy")
-    log_with_context(
-        logger, logging.DEBUG, "Rendering results to stdout", context="DISPLAY"
-    )
-
-    if not results:
-        print("No results to display.")
-        return
-
-    print("\nScan Summary:")
-    print("-" * 50)
-
-    for module_name, module_data in results.items():
-        print(f"[{module_name.upper()} Module]")
-
-        open_ports = module_data.get("open_ports", [])
-        scan_results = module_data.get("scan_results", [])
-
-        print(
-            f"Open ports: {', '.join(map(str, open_ports)) if open_ports else 'None'}"
-        )
-        print("Detailed Results:")
-
-        for entry in scan_results:
-            port = entry.get("port")
-            status = entry.get("status", "unknown")
-            service = entry.get("service", "N/A")
-            error = entry.get("error", "")
-
-            line = f"  - Port {port:<5} | Status: {status:<6} | Service: {service}"
-            if error:
-                line += f" | Error: {error}"
-            print(line)
-
-        print("-" * 50)
-
-    log_with_context(
-        logger, logging.INFO, "Results displayed successfully", context="DISPLAY"
-    )
-
-
-def handle_output(results: Dict[str, Any], args: Any) -> None:
-    logger = logging.getLogger("sentinelpy")
-
-    if args.json:
-        log_with_context(
-            logger, logging.INFO, f"Exporting results to {args.json}", context="EXPORT"
-        )
-        try:
-            with open(args.json, "w") as f:
-                json.dump(results, f, indent=2)
-            log_with_context(
-                logger, logging.INFO, "Results exported successfully", context="EXPORT"
-            )
-        except Exception as e:
-            log_with_context(
-                logger, logging.ERROR, f"Export failed: {str(e)}", context="EXPORT"
-            )
-            raise
-
-    if args.print_json:
-        log_with_context(
-            logger, logging.DEBUG, "Printing results as JSON", context="EXPORT"
-        )
-        print(json.dumps(results, indent=2))
-        log_with_context(
-            logger, logging.INFO, "Results printed as JSON", context="EXPORT"
-        )
-    else:
-        export_to_json(results)
+import logging
+import sys
+from typing import Any, Dict, List
+
+from scanner.logging import log_with_context
+from scanner.utils.exporter import export_to_json, print_json, write_json
+
+_LOGGER = logging.getLogger("sentinelpy")
+
+
+def _render_module(module_name: str, module_data: Dict[str, Any]) -> List[str]:
+    """
+    Format one module's results as a block of text lines.
+
+    Args:
+        module_name: Name of the scan module (e.g. "tcp").
+        module_data: Module results with 'open_ports' and 'scan_results'.
+
+    Returns:
+        Lines of the module block, without trailing newlines.
+    """
+    open_ports = module_data.get("open_ports", [])
+    scan_results = module_data.get("scan_results", [])
+
+    lines = [
+        f"[{module_name.upper()} Module]",
+        f"Open ports: {', '.join(map(str, open_ports)) if open_ports else 'None'}",
+        "Detailed Results:",
+    ]
+
+    for entry in scan_results:
+        port = entry.get("port")
+        status = entry.get("status", "unknown")
+        service = entry.get("service", "N/A")
+        error = entry.get("error", "")
+
+        line = f"  - Port {port:<5} | Status: {status:<6} | Service: {service}"
+        if error:
+            line += f" | Error: {error}"
+        lines.append(line)
+
+    lines.append("-" * 50)
+    return lines
+
+
+def display_results(results: Dict[str, Any]) -> None:
+    if not results:
+        print("No results to display.")
+        return
+
+    log_with_context(
+        _LOGGER, logging.DEBUG, "Rendering results to stdout", context="DISPLAY"
+    )
+
+    # Collect the whole summary and emit it with a single write
+    out = ["", "Scan Summary:", "-" * 50]
+    for module_name, module_data in results.items():
+        out.extend(_render_module(module_name, module_data))
+    sys.stdout.write("\n".join(out) + "\n")
+
+    log_with_context(
+        _LOGGER, logging.INFO, "Results displayed successfully", context="DISPLAY"
+    )
+
+
+def handle_output(results: Dict[str, Any], args: Any) -> None:
+    if args.json:
+        log_with_context(
+            _LOGGER,
+            logging.INFO,
+            "Exporting results to %s",
+            args.json,
+            context="EXPORT",
+        )
+        try:
+            write_json(results, args.json)
+            log_with_context(
+                _LOGGER, logging.INFO, "Results exported successfully", context="EXPORT"
+            )
+        except Exception as e:
+            log_with_context(
+                _LOGGER, logging.ERROR, "Export failed: %s", e, context="EXPORT"
+            )
+            raise
+
+    if args.print_json:
+        log_with_context(
+            _LOGGER, logging.DEBUG, "Printing results as JSON", context="EXPORT"
+        )
+        print_json(results)
+        log_with_context(
+            _LOGGER, logging.INFO, "Results printed as JSON", context="EXPORT"
+        )
+    else:
+        export_to_json(results)
@@ -1,9 +1,10 @@
-from scanner.utils.logging_tools import clear_logs, show_logs
+from scanner.logging import flush_logs
+from scanner.utils.logging_tools import show_logs
 
 
 def handle_utility_operations(args):
     """
-    Handle utility operations such as log display or cleanup.
+    Handle utility operations such as log display.
 
     Args:
         args: Parsed CLI arguments
@@ -11,13 +12,9 @@ def handle_utility_operations(args):
     Returns:
         bool: True if an operation was performed, False otherwise
     """
-    if getattr(args, "clear_logs", False):
-        clear_logs()
-        print("Logs successfully deleted.")
-        return True
-
-    if getattr(args, "show_logs", False):
-        logs = show_logs(getattr(args, "logfile", None))
+    if args.show_logs:
+        flush_logs()
+        logs = show_logs(args.logfile)
         print("Log contents:\n", logs)
         return True
 
@@ -1,182 +1,266 @@
-import argparse
-import re
-from typing import List, Optional
-
-from ..exceptions import PortRangeError
-
-
-class CLIValidationError(Exception):
-    """Custom exception for CLI validation errors."""
-
-    pass
-
-
-def validate_host(host: str) -> str:
-    """
-    Validate the target host.
-
-    Args:
-        host: IP address or domain name
-
-    Returns:
-        A validated host string.
-
-    Raises:
-        CLIValidationError: If the host format is invalid.
-    """
-    ip_pattern = r"^(\d{1,3}\.){3}\d{1,3}$"
-    if re.match(ip_pattern, host):
-        octets = host.split(".")
-        if not all(0 <= int(octet) <= 255 for octet in octets):
-            raise CLIValidationError(
-                "Invalid IP address: octets must be between 0 and 255"
-            )
-        return host
-
-    domain_pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z]{2,})*$"
-    if not re.match(domain_pattern, host):
-        raise CLIValidationError(
-            "Invalid host: must be a valid IP address or domain name"
-        )
-
-    return host
-
-
-def validate_timeout(timeout: float) -> float:
-    """
-    Validate the timeout value.
-
-    Args:
-        timeout: Timeout in seconds
-
-    Returns:
-        The validated timeout.
-
-    Raises:
-        CLIValidationError: If the timeout is out of bounds.
-    """
-    if not 0.1 <= timeout <= 10.0:
-        raise CLIValidationError("Timeout must be between 0.1 and 10.0 seconds")
-    return timeout
-
-
-def is_utility_only(args: argparse.Namespace, remaining: list) -> bool:
-    """
-    Check if only utility options were passed.
-
-    Args:
-        args: Parsed arguments
-        remaining: Remaining unparsed arguments
-
-    Returns:
-        True if only utility options are requested.
-    """
-    return (args.clean_exports or args.list_exports) and not remaining
-
-
-def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
-    """
-    Parse and validate CLI arguments.
-
-    Args:
-        argv: Simulated argument list (for testing). Defaults to sys.argv[1:].
-
-    Returns:
-        A namespace with validated arguments.
-
-    Raises:
-        CLIValidationError (wrapped as parser.error) on failure.
-    """
-    # Phase 1 — parse only utility flags first
-    pre_parser = argparse.ArgumentParser(add_help=False)
-    pre_parser.add_argument("--clean-exports", action="store_true")
-    pre_parser.add_argument("--list-exports", action="store_true")
-    pre_args, remaining_args = pre_parser.parse_known_args(argv)
-
-    if is_utility_only(pre_args, remaining_args):
-        return pre_args
-
-    # Phase 2 — full argument parser
-    parser = argparse.ArgumentParser(description="Modular vulnerability scanner")
-
-    # Required arguments
-    required = parser.add_argument_group("Required arguments")
-    required.add_argument("host", help="Target host (e.g., IP or domain name)")
-    required.add_argument("ports", help="Port range (e.g., 20-80)")
-
-    # Module selection
-    required.add_argument(
-        "--modules",
-        nargs="+",
-        choices=["tcp", "http", "ssl"],
-        default=["tcp"],
-        help="Scan modules to enable (default: tcp)",
-    )
-
-    # Scan options
-    scan_opts = parser.add_argument_group("Scan options")
-    scan_opts.add_argument(
-        "-t",
-        "--timeout",
-        type=float,
-        default=0.5,
-        help="Timeout per scan request (default: 0.5s)",
-    )
-    scan_opts.add_argument(
-        "--ssl-port", type=int, default=443, help="Port for SSL/TLS (default: 443)"
-    )
-    scan_opts.add_argument(
-        "--no-verify", action="store_true", help="Disable SSL certificate verification"
-    )
-
-    # Output options
-    output_opts = parser.add_argument_group("Output options")
-    output_opts.add_argument(
-        "--json", metavar="FILENAME", help="Export results to JSON file"
-    )
-    output_opts.add_argument(
-        "--print-json", action="store_true", help="Print results in JSON format"
-    )
-
-    # Logging options
-    log_opts = parser.add_argument_group("Logging options")
-    log_opts.add_argument("--logfile", metavar="FILENAME", help="Log to a custom file")
-    log_opts.add_argument(
-        "--show-logs", action="store_true", help="Show logs after execution"
-    )
-    log_opts.add_argument(
-        "--clear-logs", action="store_true", help="Clear logs before running"
-    )
-
-    # Utility options
-    utility_opts = parser.add_argument_group("Utility operations")
-    utility_opts.add_argument(
-        "--clean-exports", action="store_true", help="Delete previous JSON exports"
-    )
-    utility_opts.add_argument(
-        "--list-exports", action="store_true", help="List saved JSON exports"
-    )
-
-    # Display options
-    display_opts = parser.add_argument_group("Display options")
-    display_opts.add_argument(
-        "--verbose", action="store_true", help="Show closed ports too"
-    )
-
-    # Parse and validate
-    args = parser.parse_args(remaining_args)
-
-    try:
-        # Import here to avoid circular dependency
-        from ..utils.validators import parse_port_range
-
-        args.ports = parse_port_range(args.ports)
-        args.timeout = validate_timeout(args.timeout)
-        args.host = validate_host(args.host)
-    except PortRangeError as e:
-        # Wrap PortRangeError as parser error
-        parser.error(str(e))
-    except CLIValidationError as e:
-        parser.error(str(e))
-
-    return args
+import argparse
+import functools
+import ipaddress
+import re
+import string
+from typing import List, Optional, Tuple
+
+from ..exceptions import PortRangeError
+from ..utils.validators import parse_port_range
+
+_IP_RE = re.compile(r"^(\d{1,3}\.){3}\d{1,3}$")
+# Deletes every character allowed in a hostname; anything left over is invalid
+_STRIP_HOSTNAME_CHARS = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "-."
+)
+
+
+class CLIValidationError(Exception):
+    """Custom exception for CLI validation errors."""
+
+    pass
+
+
+def _is_hostname(host: str) -> bool:
+    """
+    Check a domain name with a linear scan instead of a backtracking regex.
+
+    Labels are 1-63 letters, digits or hyphens and may not start or end
+    with a hyphen. The last label may not be all digits, so partial IPv4
+    addresses like "10.1.1" are not taken for names.
+
+    Args:
+        host: Candidate domain name
+
+    Returns:
+        True if the name is well formed.
+    """
+    if not 0 < len(host) <= 253 or host.translate(_STRIP_HOSTNAME_CHARS):
+        return False
+    labels = host.split(".")
+    if labels[-1].isdigit():
+        return False
+    return all(
+        0 < len(label) <= 63 and label[0] != "-" and label[-1] != "-"
+        for label in labels
+    )
+
+
+def validate_host(host: str) -> str:
+    """
+    Validate the target host.
+
+    Args:
+        host: IPv4/IPv6 address or domain name
+
+    Returns:
+        A validated host string.
+
+    Raises:
+        CLIValidationError: If the host format is invalid.
+    """
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+
+    # Dotted quads that ipaddress rejected have an out-of-range or
+    # zero-padded octet; report that rather than a generic host error
+    if _IP_RE.match(host):
+        raise CLIValidationError(
+            "Invalid IP address: octets must be between 0 and 255, without leading zeros"
+        )
+
+    if not _is_hostname(host):
+        raise CLIValidationError(
+            "Invalid host: must be a valid IP address or domain name"
+        )
+
+    return host
+
+
+def validate_timeout(timeout: float) -> float:
+    """
+    Validate the timeout value.
+
+    Args:
+        timeout: Timeout in seconds
+
+    Returns:
+        The validated timeout.
+
+    Raises:
+        CLIValidationError: If the timeout is out of bounds.
+    """
+    if not 0.1 <= timeout <= 10.0:
+        raise CLIValidationError("Timeout must be between 0.1 and 10.0 seconds")
+    return timeout
+
+
+def validate_delay(delay: Optional[float]) -> Optional[float]:
+    """
+    Validate the delay between rate-limited probes.
+
+    Args:
+        delay: Delay in seconds, or None to use the preset
+
+    Returns:
+        The validated delay.
+
+    Raises:
+        CLIValidationError: If the delay is negative.
+    """
+    if delay is not None and delay < 0:
+        raise CLIValidationError("Delay cannot be negative")
+    return delay
+
+
+def is_utility_only(args: argparse.Namespace, remaining: list) -> bool:
+    """
+    Check if only utility options were passed.
+
+    Args:
+        args: Parsed arguments
+        remaining: Remaining unparsed arguments
+
+    Returns:
+        True if only utility options are requested.
+    """
+    return (args.clean_exports or args.list_exports) and not remaining
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parsers() -> Tuple[argparse.ArgumentParser, argparse.ArgumentParser]:
+    """
+    Build the CLI parsers once and reuse them for every parse_args call.
+
+    Returns:
+        The utility-flag pre-parser and the full argument parser.
+    """
+    # Pre-parser for utility flags, which may be given without host and ports
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--clean-exports", action="store_true")
+    pre_parser.add_argument("--list-exports", action="store_true")
+    pre_parser.add_argument("--clear-logs", action="store_true")
+    # Options the run path reads even when only utility flags were given
+    pre_parser.set_defaults(show_logs=False, logfile=None)
+
+    # Full argument parser
+    parser = argparse.ArgumentParser(description="Modular vulnerability scanner")
+
+    # Required arguments
+    required = parser.add_argument_group("Required arguments")
+    required.add_argument("host", help="Target host (e.g., IP or domain name)")
+    required.add_argument("ports", help="Port range (e.g., 20-80)")
+
+    # Module selection
+    required.add_argument(
+        "--modules",
+        nargs="+",
+        choices=["tcp", "http", "ssl"],
+        default=["tcp"],
+        help="Scan modules to enable (default: tcp)",
+    )
+
+    # Scan options
+    scan_opts = parser.add_argument_group("Scan options")
+    scan_opts.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=0.5,
+        help="Timeout per scan request (default: 0.5s)",
+    )
+    scan_opts.add_argument(
+        "--ssl-port", type=int, default=443, help="Port for SSL/TLS (default: 443)"
+    )
+    scan_opts.add_argument(
+        "--no-verify", action="store_true", help="Disable SSL certificate verification"
+    )
+    scan_opts.add_argument(
+        "--preset",
+        choices=["stealth", "normal", "aggressive", "none"],
+        help="Rate limit preset for HTTP/SSL probes (default: no rate limiting)",
+    )
+    scan_opts.add_argument(
+        "--delay",
+        type=float,
+        metavar="SECONDS",
+        help="Seconds between HTTP/SSL probes, overrides --preset",
+    )
+
+    # Output options
+    output_opts = parser.add_argument_group("Output options")
+    output_opts.add_argument(
+        "--json", metavar="FILENAME", help="Export results to JSON file"
+    )
+    output_opts.add_argument(
+        "--print-json", action="store_true", help="Print results in JSON format"
+    )
+
+    # Logging options
+    log_opts = parser.add_argument_group("Logging options")
+    log_opts.add_argument("--logfile", metavar="FILENAME", help="Log to a custom file")
+    log_opts.add_argument(
+        "--show-logs", action="store_true", help="Show logs after execution"
+    )
+    log_opts.add_argument(
+        "--clear-logs", action="store_true", help="Clear logs before running"
+    )
+
+    # Utility options
+    utility_opts = parser.add_argument_group("Utility operations")
+    utility_opts.add_argument(
+        "--clean-exports", action="store_true", help="Delete previous JSON exports"
+    )
+    utility_opts.add_argument(
+        "--list-exports", action="store_true", help="List saved JSON exports"
+    )
+
+    # Display options
+    display_opts = parser.add_argument_group("Display options")
+    display_opts.add_argument(
+        "--verbose", action="store_true", help="Show closed ports too"
+    )
+
+    return pre_parser, parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse and validate CLI arguments.
+
+    Args:
+        argv: Simulated argument list (for testing). Defaults to sys.argv[1:].
+
+    Returns:
+        A namespace with validated arguments.
+
+    Raises:
+        CLIValidationError (wrapped as parser.error) on failure.
+    """
+    pre_parser, parser = _get_parsers()
+
+    # Phase 1 — parse only utility flags first
+    pre_args, remaining_args = pre_parser.parse_known_args(argv)
+
+    # --clear-logs short-circuits the run, so host and ports are not required
+    if pre_args.clear_logs or is_utility_only(pre_args, remaining_args):
+        return pre_args
+
+    # Phase 2 — full argument parser, then validate
+    args = parser.parse_args(remaining_args)
+
+    try:
+        args.ports = parse_port_range(args.ports)
+        args.timeout = validate_timeout(args.timeout)
+        args.delay = validate_delay(args.delay)
+        args.host = validate_host(args.host)
+    except PortRangeError as e:
+        # Wrap PortRangeError as parser error
+        parser.error(str(e))
+    except CLIValidationError as e:
+        parser.error(str(e))
+
+    return args
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
+# Minimum seconds between progress bar redraws. Scanners update the bar once
+# per finished probe, so this keeps terminal writes off the hot path.
+PROGRESS_MININTERVAL = 0.2
+
 
 class BaseScanner(ABC):
     """
@@ -32,7 +36,7 @@ class BaseScanner(ABC):
         The exact signature and behavior will vary depending on the scanner type:
 
         - TCPScanner: scan(host, ports_range: str) -> Dict[str, list]
-        - HTTPScanner: scan(host, ports: List[int]) -> Dict[str, Any]
+        - HTTPScanner: scan(host, ports: Sequence[int]) -> Dict[str, Any]
         - SSLScanner: scan(host, port: int = 443) -> Dict[str, Any]
 
         Args:
@@ -1,96 +1,360 @@
-from typing import Any, Dict, List
-
-import requests
-from tqdm import tqdm
-
-from ..models.results import HTTPScanResult
-from .base import BaseScanner
-
-
-class HTTPScanner(BaseScanner):
-    def __init__(self, timeout: float = 3.0):
-        # Set the timeout for HTTP requests
-        super().__init__(timeout)
-
-    def _identify_web_server(self, server_header: str) -> str:
-        """
-        Identify common web servers from the 'Server' HTTP header.
-        Falls back to a capitalized version of the raw server string if not matched.
-        """
-        if not server_header:
-            return "Unknown"
-
-        header = server_header.lower()
-
-        if "apache" in header:
-            return "Apache"
-        elif "nginx" in header:
-            return "Nginx"
-        elif "iis" in header or "microsoft" in header:
-            return "Microsoft IIS"
-        elif "lighttpd" in header:
-            return "Lighttpd"
-        elif "gunicorn" in header:
-            return "Gunicorn"
-        elif "caddy" in header:
-            return "Caddy"
-        else:
-            # Fallback: take the first part of the header (e.g., "Apache/2.4.41") => "Apache"
-            return server_header.split("/")[0].capitalize()
-
-    def scan(self, host: str, ports: List[int]) -> Dict[str, Any]:
-        """
-        Scan a list of ports on a host using HTTP requests to detect web services.
-
-        Args:
-            host: Target host (e.g., "localhost").
-            ports: List of TCP ports to scan.
-
-        Returns:
-            Dict with open ports and detailed scan results per port.
-        """
-        open_ports = []
-        results = []
-
-        for port in tqdm(ports, desc="Scanning HTTP ports", unit="port"):
-            url = f"http://{host}:{port}/"
-
-            try:
-                # Send GET request
-                resp = requests.get(url, timeout=self.timeout)
-                server_header = resp.headers.get("Server", "Unknown")
-                server_type = self._identify_web_server(server_header)
-
-                if resp.ok:
-                    open_ports.append(port)
-
-                # Collect scan result for current port
-                results.append(
-                    {
-                        "port": port,
-                        "status": "open" if resp.ok else "closed",
-                        "status_code": resp.status_code,
-                        "server": server_type,
-                        "content_type": resp.headers.get("Content-Type", "Unknown"),
-                        "url": url,
-                    }
-                )
-
-            except Exception as e:
-                # If error occurs (timeout, connection refused, etc.)
-                results.append(
-                    {
-                        "port": port,
-                        "status": "closed",
-                        "server": "N/A",
-                        "error": str(e).split(" (")[
-                            0
-                        ],  # Only show the root error message
-                        "url": url,
-                    }
-                )
-
-        # Create HTTPScanResult
-        http_result = HTTPScanResult(open_ports=open_ports, scan_results=results)
-
-        return http_result.to_dict()
+import asyncio
+import re
+import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+from ..models.results import HTTPScanResult
+from ..utils.network import resolve_host
+from ..utils.rate_limiter import RateLimiter
+from .base import PROGRESS_MININTERVAL, BaseScanner
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Upper bound on concurrent HTTP probes, also the connection pool size.
+MAX_WORKERS = 64
+
+# Available probing strategies, see HTTPScanner.__init__.
+BACKENDS = ("thread", "asyncio")
+
+# HEAD responses meaning the server does not support HEAD; retried with GET.
+_HEAD_UNSUPPORTED = {405, 501}
+
+# Well-known web servers, matched case-insensitively in the Server header.
+_SERVER_RE = re.compile(r"apache|nginx|iis|microsoft|lighttpd|gunicorn|caddy", re.I)
+_SERVER_LABELS = {
+    "apache": "Apache",
+    "nginx": "Nginx",
+    "iis": "Microsoft IIS",
+    "microsoft": "Microsoft IIS",
+    "lighttpd": "Lighttpd",
+    "gunicorn": "Gunicorn",
+    "caddy": "Caddy",
+}
+
+
+class HTTPScanner(BaseScanner):
+    def __init__(
+        self,
+        timeout: float = 3.0,
+        backend: str = "thread",
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize the HTTP scanner.
+
+        Args:
+            timeout (float): Timeout per HTTP request in seconds.
+            backend (str): Probing strategy, one of:
+                - 'thread': requests from a thread pool over a pooled session
+                - 'asyncio': aiohttp requests on a single event loop
+            rate_limiter (Optional[RateLimiter]): Paces requests across all
+                workers; None sends them as fast as the pool allows.
+
+        Raises:
+            ValueError: If the backend is unknown.
+            ImportError: If the asyncio backend is chosen without aiohttp.
+        """
+        # Set the timeout for HTTP requests
+        super().__init__(timeout)
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}', expected one of: {', '.join(BACKENDS)}"
+            )
+        if backend == "asyncio" and not AIOHTTP_AVAILABLE:
+            raise ImportError("The asyncio HTTP backend requires aiohttp")
+        self.backend = backend
+        self.rate_limiter = rate_limiter
+
+        # One pooled session shared by all worker threads, so connections are
+        # reused instead of being set up again for every request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled session and the connections it keeps open."""
+        self._session.close()
+
+    def __enter__(self) -> "HTTPScanner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _identify_web_server(self, server_header: str) -> str:
+        """
+        Identify common web servers from the 'Server' HTTP header.
+        Falls back to a capitalized version of the raw server string if not matched.
+        """
+        if not server_header:
+            return "Unknown"
+
+        match = _SERVER_RE.search(server_header)
+        if match:
+            return _SERVER_LABELS[match.group(0).lower()]
+
+        # Fallback: take the first part of the header (e.g., "Apache/2.4.41") => "Apache"
+        return server_header.split("/", 1)[0].capitalize()
+
+    def _response_entry(
+        self, port: int, url: str, status_code: int, headers: Mapping
+    ) -> Dict[str, Any]:
+        """
+        Build the scan result entry for a port that answered.
+
+        Any HTTP response, whatever its status code, means a web server is
+        listening, so the port is reported open.
+        """
+        return {
+            "port": port,
+            "status": "open",
+            "status_code": status_code,
+            "server": self._identify_web_server(headers.get("Server", "Unknown")),
+            "content_type": headers.get("Content-Type", "Unknown"),
+            "url": url,
+        }
+
+    def _error_entry(self, port: int, url: str, error: Exception) -> Dict[str, Any]:
+        """
+        Build the scan result entry for a port whose request failed
+        (timeout, connection refused, etc.).
+        """
+        return {
+            "port": port,
+            "status": "closed",
+            "server": "N/A",
+            "error": str(error).partition(" (")[0],  # Only show the root error message
+            "url": url,
+        }
+
+    def _connect_netloc(self, host: str, netloc: str) -> str:
+        """
+        Resolve the host once for the whole scan.
+
+        Returns the URL host part probes connect to: the resolved address, or
+        ``netloc`` unchanged when the host does not resolve, in which case
+        every probe reports the failure as before.
+        """
+        try:
+            family, ip = resolve_host(host)
+        except socket.gaierror:
+            return netloc
+        return f"[{ip}]" if family == socket.AF_INET6 else ip
+
+    def _request_target(
+        self, netloc: str, address: str, port: int
+    ) -> Tuple[str, Optional[Dict[str, str]]]:
+        """
+        Build the URL a probe connects to and the Host header it sends.
+
+        When the host was resolved, the request goes to the address while the
+        Host header keeps the original name, so name-based virtual hosts
+        answer as they would for the name.
+        """
+        if address == netloc:
+            return f"http://{netloc}:{port}/", None
+        host_header = netloc if port == 80 else f"{netloc}:{port}"
+        return f"http://{address}:{port}/", {"Host": host_header}
+
+    def _probe(self, netloc: str, address: str, port: int) -> Dict[str, Any]:
+        """
+        Send a HEAD request to a port and describe the response.
+
+        Servers that reject HEAD are asked again with GET.
+
+        Args:
+            netloc: Host part of the URL, with IPv6 literals already bracketed.
+            address: Host part to connect to, see _connect_netloc.
+            port: TCP port to probe.
+
+        Returns:
+            Scan result entry for the port.
+        """
+        url = f"http://{netloc}:{port}/"
+        target, headers = self._request_target(netloc, address, port)
+
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+
+        try:
+            # Only headers are needed, so skip downloading the body
+            resp = self._session.head(
+                target, headers=headers, timeout=self.timeout, allow_redirects=False
+            )
+            if resp.status_code in _HEAD_UNSUPPORTED:
+                resp = self._session.get(
+                    target,
+                    headers=headers,
+                    timeout=self.timeout,
+                    allow_redirects=False,
+                )
+        except Exception as e:
+            return self._error_entry(port, url, e)
+
+        return self._response_entry(port, url, resp.status_code, resp.headers)
+
+    def _scan_threaded(
+        self, netloc: str, address: str, ports: Sequence[int], progress: tqdm
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe all ports from a bounded thread pool.
+
+        Args:
+            netloc: Host part of the URL.
+            address: Host part to connect to.
+            ports: Ports to probe.
+            progress: Progress bar advanced once per probed port.
+
+        Returns:
+            Scan result entries, in completion order.
+        """
+        workers = max(1, min(len(ports), MAX_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._probe, netloc, address, port) for port in ports
+            ]
+            entries = []
+            for future in as_completed(futures):
+                entries.append(future.result())
+                progress.update(1)
+        return entries
+
+    async def _probe_async(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        netloc: str,
+        address: str,
+        port: int,
+    ) -> Dict[str, Any]:
+        """
+        Send a HEAD request to a port with aiohttp, falling back to GET
+        when the server rejects HEAD.
+
+        The semaphore is taken before the request so the timeout only covers
+        the request itself, not time spent waiting for a free slot.
+        """
+        url = f"http://{netloc}:{port}/"
+        target, headers = self._request_target(netloc, address, port)
+
+        # Pace before taking a slot, so waiting coroutines do not hold one
+        if self.rate_limiter:
+            await self.rate_limiter.wait_async()
+
+        async with semaphore:
+            try:
+                async with session.head(
+                    target, headers=headers, allow_redirects=False
+                ) as resp:
+                    status, resp_headers = resp.status, resp.headers
+                if status in _HEAD_UNSUPPORTED:
+                    async with session.get(
+                        target, headers=headers, allow_redirects=False
+                    ) as resp:
+                        status, resp_headers = resp.status, resp.headers
+            except Exception as e:
+                return self._error_entry(port, url, e)
+
+        return self._response_entry(port, url, status, resp_headers)
+
+    async def _scan_async(
+        self, netloc: str, address: str, ports: Sequence[int], progress: tqdm
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe all ports concurrently on a single event loop.
+
+        Args:
+            netloc: Host part of the URL.
+            address: Host part to connect to.
+            ports: Ports to probe.
+            progress: Progress bar advanced once per probed port.
+
+        Returns:
+            Scan result entries, in port order.
+        """
+        semaphore = asyncio.Semaphore(MAX_WORKERS)
+        connector = aiohttp.TCPConnector(limit=MAX_WORKERS, ssl=False)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+
+            async def probe(port: int) -> Dict[str, Any]:
+                entry = await self._probe_async(
+                    session, semaphore, netloc, address, port
+                )
+                progress.update(1)
+                return entry
+
+            return await asyncio.gather(*(probe(port) for port in ports))
+
+    def _run_backend(
+        self, netloc: str, address: str, ports: Sequence[int], progress: tqdm
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe the ports with the configured backend.
+
+        The asyncio backend falls back to the thread pool when the caller is
+        already running an event loop, where ``asyncio.run`` cannot be used.
+        """
+        if self.backend == "asyncio":
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._scan_async(netloc, address, ports, progress))
+        return self._scan_threaded(netloc, address, ports, progress)
+
+    def scan(self, host: str, ports: Sequence[int]) -> Dict[str, Any]:
+        """
+        Scan a list of ports on a host using HTTP requests to detect web services.
+
+        Up to MAX_WORKERS ports are probed concurrently, from a thread pool or
+        an aiohttp event loop depending on the backend, so the scan takes
+        roughly one timeout per batch of ports rather than one per port.
+
+        Args:
+            host: Target host (e.g., "localhost").
+            ports: TCP ports to scan, e.g. a list or a range.
+
+        Returns:
+            Dict with open ports and detailed scan results per port.
+        """
+        # IPv6 literals must be bracketed in URLs
+        netloc = f"[{host}]" if ":" in host else host
+        # One lookup for the whole scan instead of one per probe
+        address = self._connect_netloc(host, netloc)
+
+        with tqdm(
+            total=len(ports),
+            desc="Scanning HTTP ports",
+            unit="port",
+            mininterval=PROGRESS_MININTERVAL,
+            smoothing=0,
+        ) as progress:
+            by_port = {
+                entry["port"]: entry
+                for entry in self._run_backend(netloc, address, ports, progress)
+            }
+
+        # Report in the order the ports were requested
+        results = [by_port[port] for port in ports]
+        open_ports = [entry["port"] for entry in results if entry["status"] == "open"]
+
+        # Create HTTPScanResult
+        http_result = HTTPScanResult(open_ports=open_ports, scan_results=results)
+
+        return http_result.to_dict()
@@ -1,70 +1,310 @@
-import socket
-import ssl
-from datetime import datetime, timezone
-from typing import Any, Dict
-
-from ..models.results import SSLScanResult
-from .base import BaseScanner
-
-
-class SSLScanner(BaseScanner):
-    def __init__(self, timeout=5.0, verify=True):
-        super().__init__(timeout)
-        self.verify = verify
-
-    def _parse_dt(self, s):
-        if not isinstance(s, str):
-            return None
-        for fix in (lambda x: x, lambda x: x.replace("  ", " ")):
-            try:
-                dt = datetime.strptime(fix(s), "%b %d %H:%M:%S %Y %Z").replace(
-                    tzinfo=timezone.utc
-                )
-                return dt
-            except Exception:
-                pass
-        return None
-
-    def _flatten(self, name):
-        out = {}
-        for group in name:
-            for k, v in group:
-                out[k] = v
-        return out
-
-    def scan(self, host: str, port: int = 443) -> Dict[str, Any]:
-        ctx = ssl.create_default_context()
-        if not self.verify:
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-
-        try:
-            with socket.create_connection((host, port), timeout=self.timeout) as sock:
-                with ctx.wrap_socket(sock, server_hostname=host) as ssock:
-                    cert = ssock.getpeercert()
-
-            if not cert:
-                return SSLScanResult(
-                    ok=False, error="No certificate presented"
-                ).to_dict()
-
-            subj = self._flatten(cert.get("subject", ()))
-            issu = self._flatten(cert.get("issuer", ()))
-            nb = self._parse_dt(cert.get("notBefore"))
-            na = self._parse_dt(cert.get("notAfter"))
-            days_left = (na - datetime.now(timezone.utc)).days if na else None
-
-            return SSLScanResult(
-                ok=True,
-                issued_to=subj.get("commonName"),
-                issued_by=issu.get("commonName"),
-                valid_from=nb.isoformat() if nb else None,
-                valid_until=na.isoformat() if na else None,
-                days_left=days_left,
-                expired=(days_left is not None and days_left < 0),
-            ).to_dict()
-
-        except ssl.SSLError as e:
-            return SSLScanResult(ok=False, error=f"SSL error: {e}").to_dict()
-        except OSError as e:
-            return SSLScanResult(ok=False, error=f"Socket error: {e}").to_dict()
+import functools
+import os
+import selectors
+import socket
+import ssl
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.results import SSLScanResult
+from ..utils.network import CONNECT_PENDING, resolve_host
+from ..utils.rate_limiter import RateLimiter
+from .base import BaseScanner
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+# Upper bound on handshakes in flight at once in SSLScanner.scan_many.
+MAX_HANDSHAKES = 256
+
+Target = Tuple[str, int]
+
+# Month abbreviations used in certificate dates (always English, "C" locale)
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+@functools.lru_cache(maxsize=2)
+def _client_context(verify: bool) -> ssl.SSLContext:
+    """
+    Return the shared client context for the given verification mode.
+
+    Building a default context loads the system CA bundle, so each mode is
+    built once per process and reused by every scanner and scan.
+    """
+    ctx = ssl.create_default_context()
+    if not verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class SSLScanner(BaseScanner):
+    def __init__(
+        self, timeout=5.0, verify=True, rate_limiter: Optional[RateLimiter] = None
+    ):
+        super().__init__(timeout)
+        self.verify = verify
+        self.rate_limiter = rate_limiter
+        self._ctx = _client_context(verify)
+
+    def _parse_dt(self, s):
+        # Certificate dates have a fixed layout, e.g. "Jun  1 12:00:00 2025 GMT"
+        # (days are space-padded), so split them directly instead of strptime
+        if not isinstance(s, str):
+            return None
+        try:
+            month, day, clock, year, _ = s.split()
+            hour, minute, second = clock.split(":")
+            return datetime(
+                int(year),
+                _MONTHS[month],
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                tzinfo=timezone.utc,
+            )
+        except (KeyError, ValueError):
+            return None
+
+    def _flatten(self, name):
+        out = {}
+        for group in name:
+            for k, v in group:
+                out[k] = v
+        return out
+
+    def _valid_result(
+        self,
+        issued_to: Optional[str],
+        issued_by: Optional[str],
+        nb: Optional[datetime],
+        na: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """Build the scan result for a certificate whose fields were read."""
+        days_left = (na - datetime.now(timezone.utc)).days if na else None
+
+        return SSLScanResult(
+            ok=True,
+            issued_to=issued_to,
+            issued_by=issued_by,
+            valid_from=nb.isoformat() if nb else None,
+            valid_until=na.isoformat() if na else None,
+            days_left=days_left,
+            expired=(days_left is not None and days_left < 0),
+        ).to_dict()
+
+    def _cert_result(self, cert: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the scan result from a certificate returned by getpeercert()."""
+        if not cert:
+            return SSLScanResult(ok=False, error="No certificate presented").to_dict()
+
+        subj = self._flatten(cert.get("subject", ()))
+        issu = self._flatten(cert.get("issuer", ()))
+        return self._valid_result(
+            subj.get("commonName"),
+            issu.get("commonName"),
+            self._parse_dt(cert.get("notBefore")),
+            self._parse_dt(cert.get("notAfter")),
+        )
+
+    def _der_result(self, der: Optional[bytes]) -> Dict[str, Any]:
+        """
+        Build the scan result from a DER certificate, parsed by cryptography.
+
+        Unlike getpeercert(), the DER form is returned even when verification
+        is off, and the validity dates come back as datetimes directly.
+        """
+        if not der:
+            return SSLScanResult(ok=False, error="No certificate presented").to_dict()
+
+        try:
+            cert = x509.load_der_x509_certificate(der)
+        except ValueError as e:
+            return SSLScanResult(ok=False, error=f"SSL error: {e}").to_dict()
+
+        def common_name(name) -> Optional[str]:
+            attrs = name.get_attributes_for_oid(NameOID.COMMON_NAME)
+            return attrs[0].value if attrs else None
+
+        try:
+            not_before, not_after = cert.not_valid_before_utc, cert.not_valid_after_utc
+        except AttributeError:
+            # cryptography < 42 only has the naive forms, which are in UTC
+            not_before = cert.not_valid_before.replace(tzinfo=timezone.utc)
+            not_after = cert.not_valid_after.replace(tzinfo=timezone.utc)
+
+        return self._valid_result(
+            common_name(cert.subject), common_name(cert.issuer), not_before, not_after
+        )
+
+    def _error_result(self, error: OSError) -> Dict[str, Any]:
+        """Build the scan result for a target whose connect or handshake failed."""
+        if isinstance(error, ssl.SSLError):
+            return SSLScanResult(ok=False, error=f"SSL error: {error}").to_dict()
+        return SSLScanResult(ok=False, error=f"Socket error: {error}").to_dict()
+
+    def _handshake(
+        self,
+        selector: selectors.BaseSelector,
+        ssock: ssl.SSLSocket,
+        data: Tuple[int, str],
+        results: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        """
+        Advance one non-blocking TLS handshake as far as it can go.
+
+        Waits for whichever readiness OpenSSL asks for, or records the
+        result and drops the socket from the selector once it finishes.
+        """
+        try:
+            ssock.do_handshake()
+        except ssl.SSLWantReadError:
+            selector.modify(ssock, selectors.EVENT_READ, data)
+            return
+        except ssl.SSLWantWriteError:
+            selector.modify(ssock, selectors.EVENT_WRITE, data)
+            return
+        except OSError as e:
+            selector.unregister(ssock)
+            results[data[0]] = self._error_result(e)
+            return
+
+        selector.unregister(ssock)
+        if CRYPTOGRAPHY_AVAILABLE:
+            results[data[0]] = self._der_result(ssock.getpeercert(binary_form=True))
+        else:
+            results[data[0]] = self._cert_result(ssock.getpeercert())
+
+    def _scan_batch(self, targets: List[Target]) -> List[Dict[str, Any]]:
+        """
+        Connect to every target and drive all TLS handshakes on one selector.
+
+        Each socket starts its connect immediately; once it is writable the
+        socket is wrapped and its handshake is stepped whenever the selector
+        reports the readiness OpenSSL is waiting for. Targets still pending
+        after the timeout are reported as timed out.
+
+        Args:
+            targets (List[Target]): (host, port) pairs to check.
+
+        Returns:
+            List[Dict[str, Any]]: One result per target, in target order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+        sockets = []
+
+        with selectors.DefaultSelector() as selector:
+            try:
+                for index, (host, port) in enumerate(targets):
+                    if self.rate_limiter:
+                        self.rate_limiter.wait()
+                    try:
+                        family, ip = resolve_host(host)
+                        sock = socket.socket(family, socket.SOCK_STREAM)
+                    except OSError as e:
+                        results[index] = self._error_result(e)
+                        continue
+                    sockets.append(sock)
+                    sock.setblocking(False)
+
+                    error = sock.connect_ex((ip, port))
+                    if error and error not in CONNECT_PENDING:
+                        results[index] = self._error_result(
+                            OSError(error, os.strerror(error))
+                        )
+                        continue
+                    selector.register(sock, selectors.EVENT_WRITE, (index, host))
+
+                deadline = time.monotonic() + self.timeout
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        sock, data = key.fileobj, key.data
+                        if isinstance(sock, ssl.SSLSocket):
+                            self._handshake(selector, sock, data, results)
+                            continue
+
+                        # Connect finished: wrap the socket and start the handshake
+                        selector.unregister(sock)
+                        error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                        if error:
+                            results[data[0]] = self._error_result(
+                                OSError(error, os.strerror(error))
+                            )
+                            continue
+                        try:
+                            ssock = self._ctx.wrap_socket(
+                                sock,
+                                server_hostname=data[1],
+                                do_handshake_on_connect=False,
+                            )
+                        except OSError as e:
+                            results[data[0]] = self._error_result(e)
+                            continue
+                        sockets.append(ssock)
+                        selector.register(ssock, selectors.EVENT_WRITE, data)
+                        self._handshake(selector, ssock, data, results)
+            finally:
+                for sock in sockets:
+                    sock.close()
+
+        timed_out = self._error_result(socket.timeout("timed out"))
+        return [dict(timed_out) if r is None else r for r in results]
+
+    def scan_many(self, targets: List[Target]) -> List[Dict[str, Any]]:
+        """
+        Check the certificates of many (host, port) targets concurrently.
+
+        TLS handshakes are bound by round trips, so instead of one blocking
+        handshake after another they all progress together on a single
+        thread, in batches of MAX_HANDSHAKES. Each batch takes roughly one
+        timeout period at most.
+
+        Args:
+            targets (List[Target]): (host, port) pairs to check.
+
+        Returns:
+            List[Dict[str, Any]]: One SSLScanResult dict per target, in the
+            order the targets were given.
+        """
+        results = []
+        for start in range(0, len(targets), MAX_HANDSHAKES):
+            stop = start + MAX_HANDSHAKES
+            results.extend(self._scan_batch(targets[start:stop]))
+        return results
+
+    def scan(self, host: str, port: int = 443) -> Dict[str, Any]:
+        """
+        Check the certificate presented on a single host and port.
+
+        Args:
+            host (str): Target host, also sent as the SNI server name.
+            port (int): TLS port.
+
+        Returns:
+            Dict[str, Any]: SSLScanResult fields; ``ok`` is False and
+            ``error`` explains why when no certificate could be read.
+        """
+        return self.scan_many([(host, port)])[0]
@@ -1,111 +1,477 @@
-import socket
-from typing import Dict
-
-from tqdm import tqdm
-
-from ..exceptions import HostResolutionError
-from ..models.ports import PortResult, PortScanResults
-from ..models.results import TCPScanResult
-from ..utils.validators import parse_port_range
-from .base import BaseScanner
-
-
-class TCPScanner(BaseScanner):
-    """Main port scanner implementation."""
-
-    def __init__(self, timeout: float = 0.5):
-        """
-        Initialize the port scanner.
-
-        Args:
-            timeout (float): Default timeout for port connections in seconds.
-        """
-        super().__init__(timeout)
-
-    def _check_host_resolution(self, host: str) -> None:
-        """
-        Verify that the host can be resolved.
-
-        Args:
-            host (str): Host to check.
-
-        Raises:
-            HostResolutionError: If the host cannot be resolved.
-        """
-        try:
-            socket.gethostbyname(host)
-        except socket.gaierror as e:
-            raise HostResolutionError(f"Could not resolve hostname '{host}': {str(e)}")
-
-    def _scan_single_port(self, host: str, port: int) -> PortResult:
-        """
-        Scan a single port on the target host.
-
-        Args:
-            host (str): Target host.
-            port (int): Port to scan.
-
-        Returns:
-            PortResult: Result of the port scan.
-        """
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(self.timeout)
-                result = sock.connect_ex((host, port))
-
-                status = "open" if result == 0 else "closed"
-                service = ""
-
-                if status == "open":
-                    try:
-                        service = socket.getservbyport(port)
-                    except (OSError, socket.error):
-                        service = "unknown"
-
-                return PortResult(
-                    port=port,
-                    status=status,
-                    service=service if status == "open" else "",
-                )
-
-        except socket.error as e:
-            return PortResult(port=port, status="error", error=str(e))
-
-    def scan(self, host: str, ports_range: str) -> Dict[str, list]:
-        """
-        Scan the specified TCP port range on a given host.
-
-        Args:
-            host (str): Target IP address or domain name.
-            ports_range (str): Port range in the format 'start-end' (e.g., '20-80').
-
-        Returns:
-            dict: Dictionary containing scan results:
-                - 'open_ports': List of open port numbers
-                - 'scan_results': List of dictionaries with detailed port information
-
-        Raises:
-            HostResolutionError: If the host cannot be resolved
-            PortRangeError: If the port range is invalid
-        """
-        # Verify host can be resolved
-        self._check_host_resolution(host)
-
-        # Parse and validate port range
-        start, end = parse_port_range(ports_range)
-
-        # Initialize results container
-        results = PortScanResults()
-
-        # Scan each port in range (using tqdm for progress bar)
-        for port in tqdm(range(start, end + 1), desc=f"Scanning {host}"):
-            result = self._scan_single_port(host, port)
-            results.add_result(result)
-
-        # Create TCPScanResult
-        tcp_result = TCPScanResult(
-            open_ports=results.open_ports,
-            scan_results=[vars(r) for r in results.scan_results],
-        )
-
-        return tcp_result.to_dict()
+import asyncio
+import errno
+import functools
+import selectors
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Tuple
+
+from tqdm import tqdm
+
+from ..exceptions import HostResolutionError, HostUnreachableError
+from ..models.ports import PortResult, PortScanResults
+from ..models.results import TCPScanResult
+from ..utils.network import CONNECT_PENDING, Address, resolve_host
+from ..utils.validators import PortsSpec, normalize_ports
+from .base import PROGRESS_MININTERVAL, BaseScanner
+
+# Upper bound on in-flight connection attempts, keeps us well below the
+# default per-process file descriptor limit on large port ranges.
+MAX_CONCURRENCY = 512
+
+# Worker cap for the thread-pool fallback.
+MAX_WORKERS = 256
+
+# Available probing strategies, see TCPScanner.__init__.
+BACKENDS = ("selector", "asyncio", "thread")
+
+# connect errors meaning no route to the host at all, rather than a closed port.
+_UNREACHABLE = {errno.ENETUNREACH, errno.EHOSTUNREACH}
+
+
+@functools.lru_cache(maxsize=None)
+def _service_name(port: int) -> str:
+    """
+    Return the registered service name for a port, or "unknown".
+
+    getservbyport reads the services database on every call, so names are
+    cached for the life of the process.
+    """
+    try:
+        return socket.getservbyport(port)
+    except (OSError, socket.error):
+        return "unknown"
+
+
+def _connect_status(error: int) -> str:
+    """Map a finished connect's errno to a port status."""
+    if error == 0:
+        return "open"
+    if error in _UNREACHABLE:
+        return "unreachable"
+    return "closed"
+
+
+def _loop_running() -> bool:
+    """Whether the calling thread is already running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class TCPScanner(BaseScanner):
+    """Main port scanner implementation."""
+
+    def __init__(self, timeout: float = 0.5, backend: str = "selector"):
+        """
+        Initialize the port scanner.
+
+        Args:
+            timeout (float): Default timeout for port connections in seconds.
+            backend (str): Probing strategy, one of:
+                - 'selector': non-blocking sockets multiplexed on one thread
+                - 'asyncio': non-blocking connects awaited on an event loop
+                - 'thread': blocking connects from a thread pool
+                All three report the same statuses; only the speed differs.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        super().__init__(timeout)
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}', expected one of: {', '.join(BACKENDS)}"
+            )
+        self.backend = backend
+
+    def _resolve_host(self, host: str) -> Address:
+        """
+        Resolve the host once, before any port is probed.
+
+        Args:
+            host (str): Host to resolve.
+
+        Returns:
+            Address: (address family, IP address) reused by every probe.
+
+        Raises:
+            HostResolutionError: If the host cannot be resolved.
+        """
+        try:
+            return resolve_host(host)
+        except socket.gaierror as e:
+            raise HostResolutionError(
+                f"Could not resolve hostname '{host}': {str(e)}"
+            ) from e
+
+    def _lookup_service(self, port: int) -> str:
+        """
+        Return the well-known service name for an open port.
+
+        Args:
+            port (int): Open port number.
+
+        Returns:
+            str: Service name, or "unknown" if none is registered.
+        """
+        return _service_name(port)
+
+    async def _probe(
+        self,
+        address: Address,
+        port: int,
+        semaphore: asyncio.Semaphore,
+        errors: Dict[int, str],
+    ) -> str:
+        """
+        Attempt a TCP connection to a single port on the running event loop.
+
+        Args:
+            address (Address): Resolved target address.
+            port (int): Port to probe.
+            semaphore (asyncio.Semaphore): Limits concurrent connection attempts.
+            errors (Dict[int, str]): Receives the error message if the port
+                is reported as "error".
+
+        Returns:
+            str: Port status, as for the selector backend.
+        """
+        family, ip = address
+        loop = asyncio.get_running_loop()
+
+        async with semaphore:
+            try:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+            except OSError as e:
+                errors[port] = str(e)
+                return "error"
+
+            with sock:
+                sock.setblocking(False)
+                try:
+                    await asyncio.wait_for(
+                        loop.sock_connect(sock, (ip, port)), self.timeout
+                    )
+                except asyncio.TimeoutError:
+                    return "closed"
+                except OSError as e:
+                    if e.errno is None:
+                        errors[port] = str(e)
+                        return "error"
+                    return _connect_status(e.errno)
+            return "open"
+
+    async def _scan_async(
+        self,
+        address: Address,
+        ports: List[int],
+        progress: tqdm,
+        errors: Dict[int, str],
+    ) -> Dict[int, str]:
+        """
+        Probe all ports concurrently on a single event loop.
+
+        Args:
+            address (Address): Resolved target address.
+            ports (List[int]): Ports to probe.
+            progress (tqdm): Progress bar advanced once per probed port.
+            errors (Dict[int, str]): Receives the error message of every port
+                reported as "error".
+
+        Returns:
+            Dict[int, str]: Status for every port.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+        async def probe(port: int) -> Tuple[int, str]:
+            status = await self._probe(address, port, semaphore, errors)
+            progress.update(1)
+            return port, status
+
+        return dict(await asyncio.gather(*(probe(port) for port in ports)))
+
+    def _probe_one(self, address: Address, port: int, errors: Dict[int, str]) -> str:
+        """
+        Attempt a blocking TCP connection to a single port.
+
+        Args:
+            address (Address): Resolved target address.
+            port (int): Port to probe.
+            errors (Dict[int, str]): Receives the error message if the port
+                is reported as "error".
+
+        Returns:
+            str: Port status, as for the selector backend.
+        """
+        family, ip = address
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError as e:
+            errors[port] = str(e)
+            return "error"
+
+        with sock:
+            sock.settimeout(self.timeout)
+            try:
+                return _connect_status(sock.connect_ex((ip, port)))
+            except OSError as e:
+                errors[port] = str(e)
+                return "error"
+
+    def _scan_threaded(
+        self,
+        address: Address,
+        ports: List[int],
+        progress: tqdm,
+        errors: Dict[int, str],
+    ) -> Dict[int, str]:
+        """
+        Probe all ports from a bounded thread pool.
+
+        Args:
+            address (Address): Resolved target address.
+            ports (List[int]): Ports to probe.
+            progress (tqdm): Progress bar advanced once per probed port.
+            errors (Dict[int, str]): Receives the error message of every port
+                reported as "error".
+
+        Returns:
+            Dict[int, str]: Status for every port.
+        """
+        statuses = {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(ports))) as executor:
+            futures = {
+                executor.submit(self._probe_one, address, port, errors): port
+                for port in ports
+            }
+            for future in as_completed(futures):
+                statuses[futures[future]] = future.result()
+                progress.update(1)
+
+        return statuses
+
+    def _select_batch(
+        self, family: int, ip: str, ports: List[int], errors: Dict[int, str]
+    ) -> Dict[int, str]:
+        """
+        Probe a batch of ports with non-blocking connects on a single selector.
+
+        Every socket starts its connect immediately, then the selector waits
+        for them to become writable until the timeout expires. SO_ERROR tells
+        whether the connect succeeded.
+
+        Args:
+            family (int): Address family of ``ip``.
+            ip (str): Resolved target address.
+            ports (List[int]): Ports to probe.
+            errors (Dict[int, str]): Receives the error message of every port
+                reported as "error".
+
+        Returns:
+            Dict[int, str]: Status for every port in the batch, with
+            "unreachable" for ports the network refused to route to.
+        """
+        statuses = {}
+        sockets = []
+
+        with selectors.DefaultSelector() as selector:
+            try:
+                for port in ports:
+                    try:
+                        sock = socket.socket(family, socket.SOCK_STREAM)
+                    except OSError as e:
+                        statuses[port] = "error"
+                        errors[port] = str(e)
+                        continue
+                    sockets.append(sock)
+                    sock.setblocking(False)
+
+                    try:
+                        result = sock.connect_ex((ip, port))
+                    except OSError as e:
+                        statuses[port] = "error"
+                        errors[port] = str(e)
+                        continue
+                    if result in CONNECT_PENDING:
+                        selector.register(sock, selectors.EVENT_WRITE, port)
+                    else:
+                        statuses[port] = _connect_status(result)
+
+                # One deadline for the whole batch, on the monotonic clock so
+                # wall-clock adjustments cannot stretch or cut the wait
+                deadline_ns = time.monotonic_ns() + int(self.timeout * 1e9)
+                while selector.get_map():
+                    remaining_ns = deadline_ns - time.monotonic_ns()
+                    if remaining_ns <= 0:
+                        break
+                    for key, _ in selector.select(max(remaining_ns / 1e9, 0)):
+                        error = key.fileobj.getsockopt(
+                            socket.SOL_SOCKET, socket.SO_ERROR
+                        )
+                        statuses[key.data] = _connect_status(error)
+                        selector.unregister(key.fileobj)
+            finally:
+                for sock in sockets:
+                    sock.close()
+
+        # Anything still pending timed out
+        for port in ports:
+            statuses.setdefault(port, "closed")
+        return statuses
+
+    def _settle_unreachable(
+        self, ip: str, ports: List[int], statuses: Dict[int, str], check: bool
+    ) -> None:
+        """
+        Report "unreachable" ports as closed, unless the host looks down.
+
+        The first MAX_CONCURRENCY ports double as a liveness check: if the
+        network refused to route to every one of them, the host is reported
+        unreachable instead.
+
+        Args:
+            ip (str): Resolved target address.
+            ports (List[int]): Probed ports, in scan order.
+            statuses (Dict[int, str]): Status of every port, updated in place.
+            check (bool): Whether ``ports`` starts with the ports to check.
+
+        Raises:
+            HostUnreachableError: If every checked port was unreachable.
+        """
+        checked = ports[:MAX_CONCURRENCY]
+        if check and checked and all(statuses[p] == "unreachable" for p in checked):
+            raise HostUnreachableError(f"Host {ip} is unreachable")
+        for port in ports:
+            if statuses[port] == "unreachable":
+                statuses[port] = "closed"
+
+    def _scan_selector(
+        self,
+        address: Address,
+        ports: List[int],
+        progress: tqdm,
+        errors: Dict[int, str],
+    ) -> Dict[int, str]:
+        """
+        Probe all ports with non-blocking sockets multiplexed on one thread.
+
+        Ports are handled in batches of MAX_CONCURRENCY so large ranges do not
+        exhaust file descriptors. The first batch doubles as a liveness check:
+        if the network reports the host unreachable for every port in it, the
+        scan stops there instead of waiting out the remaining batches.
+
+        Args:
+            address (Address): Resolved target address.
+            ports (List[int]): Ports to probe.
+            progress (tqdm): Progress bar advanced once per batch.
+            errors (Dict[int, str]): Receives the error message of every port
+                reported as "error".
+
+        Returns:
+            Dict[int, str]: Status for every port.
+
+        Raises:
+            HostUnreachableError: If the first batch found no route to the host.
+        """
+        family, ip = address
+        statuses = {}
+
+        for start in range(0, len(ports), MAX_CONCURRENCY):
+            stop = start + MAX_CONCURRENCY
+            batch = ports[start:stop]
+            batch_statuses = self._select_batch(family, ip, batch, errors)
+            progress.update(len(batch))
+
+            self._settle_unreachable(ip, batch, batch_statuses, check=start == 0)
+            statuses.update(batch_statuses)
+
+        return statuses
+
+    def _run_backend(
+        self, host: str, address: Address, ports: Iterable[int], errors: Dict[int, str]
+    ) -> Dict[int, str]:
+        """
+        Probe the ports of an already resolved host with the configured backend.
+
+        Ports whose probe failed outright get the "error" status, with the
+        message stored in ``errors``.
+
+        The asyncio backend falls back to the thread pool when the caller is
+        already running an event loop, where ``asyncio.run`` cannot be used.
+        """
+        ports = list(ports)
+
+        with tqdm(
+            total=len(ports),
+            desc=f"Scanning {host}",
+            mininterval=PROGRESS_MININTERVAL,
+            smoothing=0,
+        ) as progress:
+            if self.backend == "selector":
+                return self._scan_selector(address, ports, progress, errors)
+            if self.backend == "asyncio" and not _loop_running():
+                statuses = asyncio.run(
+                    self._scan_async(address, ports, progress, errors)
+                )
+            else:
+                statuses = self._scan_threaded(address, ports, progress, errors)
+
+        self._settle_unreachable(address[1], ports, statuses, check=True)
+        return statuses
+
+    def scan(self, host: str, ports_range: PortsSpec) -> Dict[str, list]:
+        """
+        Scan the specified TCP port range on a given host.
+
+        Ports are probed concurrently, so the scan takes roughly one timeout
+        period per batch of MAX_CONCURRENCY ports rather than one per port.
+
+        Args:
+            host (str): Target IP address or domain name.
+            ports_range (PortsSpec): Port range in the format 'start-end'
+                (e.g., '20-80'), a range, or an iterable of individual ports.
+
+        Returns:
+            dict: Dictionary containing scan results:
+                - 'open_ports': List of open port numbers
+                - 'scan_results': List of dictionaries with detailed port information
+
+        Raises:
+            HostResolutionError: If the host cannot be resolved
+            HostUnreachableError: If the host is unreachable
+            PortRangeError: If the port range is invalid
+        """
+        # Resolve the host once; fails fast before any socket is created
+        address = self._resolve_host(host)
+
+        # Parse and validate port range
+        ports = normalize_ports(ports_range)
+
+        # Initialize results container
+        results = PortScanResults()
+
+        errors: Dict[int, str] = {}
+        statuses = self._run_backend(host, address, ports, errors)
+        for port in ports:
+            status = statuses[port]
+            service = self._lookup_service(port) if status == "open" else ""
+            results.add_result(
+                PortResult(
+                    port=port,
+                    status=status,
+                    service=service,
+                    error=errors.get(port, ""),
+                )
+            )
+
+        # Create TCPScanResult
+        tcp_result = TCPScanResult(
+            open_ports=results.open_ports,
+            scan_results=[vars(r) for r in results.scan_results],
+        )
+
+        return tcp_result.to_dict()
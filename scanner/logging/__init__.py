@@ -1,4 +1,4 @@
-# scanner/logging/__init__.py
-from .logger import SUCCESS, log_with_context, setup_logger
-
-__all__ = ["setup_logger", "log_with_context", "SUCCESS"]
+# scanner/logging/__init__.py
+from .logger import SUCCESS, flush_logs, log_with_context, setup_logger
+
+__all__ = ["setup_logger", "log_with_context", "flush_logs", "SUCCESS"]
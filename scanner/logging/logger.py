@@ -1,149 +1,174 @@
-import logging
-import shutil
-import sys
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import Any, Optional
-
-try:
-    from rich.console import Console
-    from rich.logging import RichHandler
-    from rich.theme import Theme
-
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
-# Custom log level: SUCCESS (between INFO and WARNING)
-SUCCESS = 25
-logging.addLevelName(SUCCESS, "SUCCESS")
-
-
-# Add success() method to Logger
-def success(self, msg, *args, **kwargs):
-    if self.isEnabledFor(SUCCESS):
-        self._log(SUCCESS, msg, args, **kwargs)
-
-
-logging.Logger.success = success
-
-
-# Filter to inject context tags into log records
-class ContextFilter(logging.Filter):
-    def __init__(self, context: Optional[str] = None):
-        super().__init__()
-        self.context = context
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        record.context = f"[{self.context}]" if self.context else "[]"
-        return True
-
-
-# Rich console handler with custom theme and SUCCESS support
-class CustomRichHandler(RichHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.console = Console(
-            theme=Theme(
-                {
-                    "logging.level.success": "bold green",
-                    "logging.level.info": "bold blue",
-                    "logging.level.warning": "bold yellow",
-                    "logging.level.error": "bold red",
-                    "logging.level.critical": "bold red reverse",
-                    "logging.context": "cyan",
-                }
-            )
-        )
-
-    def get_level_text(self, record: logging.LogRecord) -> str:
-        if record.levelno == SUCCESS:
-            return "[bold green]SUCCESS[/bold green]"
-        return super().get_level_text(record)
-
-
-# Main logger setup function
-def setup_logger(logfile: Optional[str] = None) -> logging.Logger:
-    logger = logging.getLogger("sentinelpy")
-    logger.setLevel(logging.DEBUG)
-
-    if logger.handlers:
-        return logger  # Prevent duplicate handlers
-
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-
-    log_filename = logfile or "scanner.log"
-    log_path = logs_dir / log_filename
-
-    file_format = "[%(asctime)s] %(levelname)-8s | %(context)s %(message)s"
-    date_format = "%d-%m-%Y %H:%M:%S"
-    file_formatter = logging.Formatter(file_format, date_format)
-
-    # Console handler (Rich if available)
-    if RICH_AVAILABLE:
-        console_handler = CustomRichHandler(
-            level=logging.INFO,
-            rich_tracebacks=True,
-            markup=True,
-            show_time=True,
-            show_path=False,
-            enable_link_path=False,
-            show_level=True,
-        )
-    else:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(file_formatter)
-
-    # Rotating file handler for persistent logs
-    file_handler = RotatingFileHandler(
-        log_path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(file_formatter)
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-
-    return logger
-
-
-# Log with contextual tag
-def log_with_context(
-    logger: logging.Logger,
-    level: int,
-    msg: str,
-    *args: Any,
-    context: Optional[str] = None,
-    **kwargs: Any,
-) -> None:
-    context_filter = ContextFilter(context)
-    logger.addFilter(context_filter)
-    try:
-        logger.log(level, msg, *args, **kwargs)
-    finally:
-        logger.removeFilter(context_filter)
-
-
-# Utility: clear the entire logs directory
-def clear_logs() -> None:
-    logs_dir = Path("logs")
-    if logs_dir.exists():
-        shutil.rmtree(logs_dir)
-    logs_dir.mkdir(exist_ok=True)
-
-
-# Utility: read and return the content of the current log file
-def show_logs(logfile: Optional[str] = None) -> str:
-    log_filename = logfile or "scanner.log"
-    log_path = Path("logs") / log_filename
-
-    if not log_path.exists():
-        return f"No log file found at {log_path}"
-
-    try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except Exception as e:
-        return f"Error reading log file: {str(e)}"
+import atexit
+import copy
+import functools
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Optional
+
+from ..utils.logging_tools import DEFAULT_LOGFILE, LOGS_DIR
+
+try:
+    from rich.console import Console
+    from rich.logging import RichHandler
+    from rich.theme import Theme
+
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+# Custom log level: SUCCESS (between INFO and WARNING), logged through
+# log_with_context(logger, SUCCESS, ...)
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+# Background listener that writes the log file
+_listener: Optional[QueueListener] = None
+
+# Plain-text record layout, shared by the file handler and the fallback
+# console handler
+_FILE_FORMATTER = logging.Formatter(
+    "[%(asctime)s] %(levelname)-8s | %(context)s %(message)s", "%d-%m-%Y %H:%M:%S"
+)
+
+# Console styles for log levels and context tags
+_RICH_STYLES = {
+    "logging.level.success": "bold green",
+    "logging.level.info": "bold blue",
+    "logging.level.warning": "bold yellow",
+    "logging.level.error": "bold red",
+    "logging.level.critical": "bold red reverse",
+    "logging.context": "cyan",
+}
+
+
+# Shared themed console, built on first use so importing stays cheap
+@functools.lru_cache(maxsize=1)
+def _rich_console() -> "Console":
+    return Console(theme=Theme(_RICH_STYLES))
+
+
+# Filter to inject context tags into log records
+class ContextFilter(logging.Filter):
+    def __init__(self, context: Optional[str] = None):
+        super().__init__()
+        self.context = context
+        # The tag never changes, so format it once rather than per record
+        self._tag = f"[{context}]" if context else "[]"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Records that were already tagged keep their context
+        if not hasattr(record, "context"):
+            record.context = self._tag
+        return True
+
+
+# Rich console handler with custom theme and SUCCESS support
+class CustomRichHandler(RichHandler):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("console", _rich_console())
+        super().__init__(*args, **kwargs)
+
+    def get_level_text(self, record: logging.LogRecord) -> str:
+        if record.levelno == SUCCESS:
+            return "[bold green]SUCCESS[/bold green]"
+        return super().get_level_text(record)
+
+
+# Queues records for the file handler without flattening their traceback
+class _FileQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the record here and drops exc_info; only
+        # merge the message arguments, so the file formatter renders the
+        # record, traceback included, on the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Main logger setup function
+def setup_logger(logfile: Optional[str] = None) -> logging.Logger:
+    global _listener
+
+    logger = logging.getLogger("sentinelpy")
+    if logger.handlers:
+        return logger  # Already set up; also prevents duplicate handlers
+
+    logger.setLevel(logging.DEBUG)
+    LOGS_DIR.mkdir(exist_ok=True)
+    log_path = LOGS_DIR / (logfile or DEFAULT_LOGFILE)
+
+    # Console handler (Rich if available)
+    if RICH_AVAILABLE:
+        console_handler = CustomRichHandler(
+            level=logging.INFO,
+            rich_tracebacks=True,
+            # Messages carry hosts, paths and error text; parsing them as
+            # markup costs a scan per record and raises on input like "[/x]"
+            markup=False,
+            show_time=True,
+            show_path=False,
+            enable_link_path=False,
+            show_level=True,
+        )
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_FILE_FORMATTER)
+
+    # Rotating file handler for persistent logs
+    file_handler = RotatingFileHandler(
+        log_path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(_FILE_FORMATTER)
+
+    # Tags records logged without a context, so %(context)s always resolves
+    context_filter = ContextFilter()
+
+    # The console handler stays on the calling thread, so log lines keep
+    # their order relative to printed output such as --print-json
+    console_handler.addFilter(context_filter)
+    logger.addHandler(console_handler)
+
+    # Only the file writes are handed to the listener's background thread
+    log_queue = queue.Queue()
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    queue_handler = _FileQueueHandler(log_queue)
+    queue_handler.addFilter(context_filter)
+    logger.addHandler(queue_handler)
+
+    return logger
+
+
+# Wait until every queued record has been written to the log file
+def flush_logs() -> None:
+    if _listener is not None:
+        _listener.queue.join()
+
+
+# Log with contextual tag. Pass message arguments %s-style instead of
+# formatting them into msg: they are only interpolated once the record passes
+# the logger's level, so calls below it cost a single level check.
+def log_with_context(
+    logger: logging.Logger,
+    level: int,
+    msg: str,
+    *args: Any,
+    context: Optional[str] = None,
+    **kwargs: Any,
+) -> None:
+    # Skip building the record entirely when it would be dropped anyway
+    if not logger.isEnabledFor(level):
+        return
+
+    # The tag travels on the record itself; untagged records get the default
+    # context from the handler's filter
+    if context:
+        kwargs["extra"] = {**(kwargs.get("extra") or {}), "context": f"[{context}]"}
+    logger.log(level, msg, *args, **kwargs)
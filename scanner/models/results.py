@@ -14,8 +14,13 @@ class TCPScanResult:
     scan_results: List[Dict[str, Any]] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary format for JSON serialization.
+
+        The per-port entries are already plain dicts owned by this result, so
+        they are handed over as is rather than deep-copied by ``asdict``.
+        """
+        return {"open_ports": self.open_ports, "scan_results": self.scan_results}
 
 
 @dataclass
@@ -30,8 +35,13 @@ class HTTPScanResult:
     scan_results: List[Dict[str, Any]] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary format for JSON serialization.
+
+        The per-port entries are already plain dicts owned by this result, so
+        they are handed over as is rather than deep-copied by ``asdict``.
+        """
+        return {"open_ports": self.open_ports, "scan_results": self.scan_results}
 
 
 @dataclass
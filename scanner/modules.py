@@ -1,31 +1,63 @@
-from typing import Dict
-
-from scanner.core.http import HTTPScanner
-from scanner.core.ssl import SSLScanner
-from scanner.core.tcp import TCPScanner
-
-
-def run_selected_modules(args, logger) -> Dict[str, list]:
-    results = {}
-
-    start_port, end_port = args.ports
-    port_range_str = f"{start_port}-{end_port}"
-
-    if not hasattr(args, "modules") or not args.modules:
-        tcp = TCPScanner(timeout=args.timeout)
-        results["tcp"] = tcp.scan(args.host, port_range_str)
-        return results
-
-    if "tcp" in args.modules:
-        tcp = TCPScanner(timeout=args.timeout)
-        results["tcp"] = tcp.scan(args.host, port_range_str)
-
-    if "http" in args.modules:
-        http = HTTPScanner(timeout=args.timeout)
-        results["http"] = http.scan(args.host, list(range(start_port, end_port + 1)))
-
-    if "ssl" in args.modules:
-        ssl_scanner = SSLScanner(timeout=args.timeout, verify=not args.no_verify)
-        results["ssl"] = ssl_scanner.scan(args.host, getattr(args, "ssl_port", 443))
-
-    return results
+from typing import Dict, Optional
+
+from scanner.core.tcp import TCPScanner
+from scanner.utils.rate_limiter import RateLimiter
+
+# The HTTP and SSL scanners are imported only when their module is selected:
+# requests alone accounts for most of the CLI's startup time, and the default
+# TCP-only scan never needs it.
+
+
+def create_rate_limiter(args) -> Optional[RateLimiter]:
+    """
+    Build the rate limiter shared by the HTTP and SSL modules.
+
+    Probes are not paced unless --preset or --delay is given; an explicit
+    --delay takes precedence over --preset.
+
+    Args:
+        args: Parsed CLI arguments
+
+    Returns:
+        The rate limiter, or None when rate limiting is disabled.
+    """
+    if args.delay is not None:
+        return RateLimiter(args.delay)
+    if args.preset is None:
+        return None
+    return RateLimiter.from_preset(args.preset)
+
+
+def run_selected_modules(args, logger) -> Dict[str, list]:
+    results = {}
+
+    start_port, end_port = args.ports
+    ports = range(start_port, end_port + 1)
+    # TCP is the default module when none is selected
+    modules = args.modules or ("tcp",)
+
+    if "tcp" in modules:
+        tcp = TCPScanner(timeout=args.timeout)
+        results["tcp"] = tcp.scan(args.host, ports)
+
+    rate_limiter = None
+    if "http" in modules or "ssl" in modules:
+        rate_limiter = create_rate_limiter(args)
+
+    if "http" in modules:
+        from scanner.core.http import HTTPScanner
+
+        with HTTPScanner(timeout=args.timeout, rate_limiter=rate_limiter) as http:
+            results["http"] = http.scan(args.host, ports)
+
+    if "ssl" in modules:
+        from scanner.core.ssl import SSLScanner
+
+        ssl_scanner = SSLScanner(
+            timeout=args.timeout,
+            verify=not args.no_verify,
+            rate_limiter=rate_limiter,
+        )
+        results["ssl"] = ssl_scanner.scan(args.host, args.ssl_port)
+
+    return results
@@ -1,76 +1,186 @@
-import json
-import re
-from datetime import datetime
-from pathlib import Path
-from typing import Any
-
-# Define export directory path
-EXPORT_DIR = Path(__file__).resolve().parent.parent / "exports"
-
-
-def safe_filename(name: str) -> str:
-    """
-    Sanitize the provided filename by replacing unsafe characters.
-    """
-    return re.sub(r"[^a-zA-Z0-9_\-\.]", "_", name)
-
-
-def export_to_json(data: Any, filename: str = None) -> None:
-    """
-    Export scan results to a JSON file.
-    If no filename is provided, a timestamped one is generated automatically.
-    """
-    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
-
-    if filename:
-        filename = safe_filename(filename)
-        if not filename.endswith(".json"):
-            filename += ".json"
-    else:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"scan_{timestamp}.json"
-
-    full_path = EXPORT_DIR / filename
-
-    try:
-        with open(full_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        print(f"\nResults exported to: {full_path}")
-    except Exception as e:
-        print(f"Error while exporting to JSON: {e}")
-
-
-def clean_exports() -> None:
-    """
-    Delete all JSON files inside the export directory.
-    """
-    if EXPORT_DIR.exists() and EXPORT_DIR.is_dir():
-        deleted = 0
-        for file in EXPORT_DIR.glob("**/*.json"):
-            try:
-                file.unlink()
-                deleted += 1
-            except Exception as e:
-                print(f"Failed to delete {file}: {e}")
-        print(f"{deleted} JSON file(s) deleted.")
-    else:
-        print("No export directory found. Nothing to clean.")
-
-
-def list_exports() -> None:
-    """
-    List all existing JSON export files in the export directory.
-    Files are sorted by name in reverse order (newest first).
-    """
-    # Create the export directory if it doesn't exist
-    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
-
-    json_files = list(EXPORT_DIR.glob("*.json"))
-
-    if not json_files:
-        print("No JSON exports found.")
-        return
-
-    print("Existing exports:")
-    for file in sorted(json_files, reverse=True):
-        print(f"  - {file.name}")
+import json
+import os
+import re
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Define export directory path
+EXPORT_DIR = Path(__file__).resolve().parent.parent / "exports"
+
+# Characters kept as-is in export filenames; everything else becomes "_".
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
+_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9_\-\.]")
+# Indexed by code point; a flat sequence translates faster than a dict.
+_ASCII_TABLE = tuple(chr(c) if chr(c) in _SAFE_CHARS else "_" for c in range(128))
+
+
+def safe_filename(name: str) -> str:
+    """
+    Sanitize the provided filename by replacing unsafe characters.
+
+    ASCII names, the usual case, go through a str.translate table; the
+    regex is only needed once non-ASCII characters are involved.
+    """
+    if name.isascii():
+        return name.translate(_ASCII_TABLE)
+    return _UNSAFE_RE.sub("_", name)
+
+
+def _dumps_bytes(data: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def iter_json(data: Any) -> Iterator[bytes]:
+    """
+    Yield data as indented JSON, one top-level entry at a time.
+
+    Only one module's results are serialized at any moment, so memory stays
+    bounded by the largest entry instead of the whole document. With the
+    stdlib encoder the output is byte-identical to json.dumps(data, indent=2).
+    With orjson it is equivalent JSON except that non-ASCII text is written
+    as UTF-8 rather than \\u escapes, and NaN/Infinity become null.
+    """
+    if not isinstance(data, dict) or not data:
+        yield _dumps_bytes(data)
+        return
+
+    yield b"{\n"
+    last = len(data) - 1
+    for i, (key, value) in enumerate(data.items()):
+        # Re-indent the nested document one level to sit inside the object
+        entry = _dumps_bytes(value).replace(b"\n", b"\n  ")
+        yield b"  " + _dumps_bytes(str(key)) + b": " + entry
+        yield b",\n" if i < last else b"\n"
+    yield b"}"
+
+
+def write_json(data: Any, path: Union[str, Path]) -> None:
+    """
+    Write data to a file as indented JSON.
+
+    Entries are streamed through iter_json into a 1 MiB write buffer, using
+    orjson when installed and the stdlib json module otherwise.
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.writelines(iter_json(data))
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string, with orjson when available.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def print_json(data: Any) -> None:
+    """
+    Print data as indented JSON to stdout.
+
+    The encoded bytes go straight to the binary stdout buffer, skipping the
+    text layer's re-encode. Streams without a binary buffer get plain text.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(dumps_json(data) + "\n")
+        return
+
+    # Anything already written through the text layer must come out first
+    sys.stdout.flush()
+    buffer.writelines(iter_json(data))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def export_to_json(data: Any, filename: str = None) -> None:
+    """
+    Export scan results to a JSON file.
+    If no filename is provided, a timestamped one is generated automatically.
+    """
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+
+    if filename:
+        filename = safe_filename(filename)
+        if not filename.endswith(".json"):
+            filename += ".json"
+    else:
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        filename = f"scan_{timestamp}.json"
+
+    full_path = EXPORT_DIR / filename
+
+    try:
+        write_json(data, full_path)
+        print(f"\nResults exported to: {full_path}")
+    except Exception as e:
+        print(f"Error while exporting to JSON: {e}")
+
+
+def _iter_exports(root: Union[str, Path], recursive: bool) -> Iterator[os.DirEntry]:
+    """
+    Yield the JSON files under root, optionally descending into subdirectories.
+
+    os.scandir hands back the file type with each directory entry, so the
+    walk costs one directory read per folder instead of a stat per file.
+    Symlinks are neither followed nor reported.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _iter_exports(entry.path, recursive)
+            elif entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def clean_exports() -> None:
+    """
+    Delete all JSON files inside the export directory.
+    """
+    if EXPORT_DIR.is_dir():
+        deleted = 0
+        for entry in _iter_exports(EXPORT_DIR, recursive=True):
+            try:
+                os.unlink(entry.path)
+                deleted += 1
+            except OSError as e:
+                print(f"Failed to delete {entry.path}: {e}")
+        print(f"{deleted} JSON file(s) deleted.")
+    else:
+        print("No export directory found. Nothing to clean.")
+
+
+def list_exports() -> None:
+    """
+    List all existing JSON export files in the export directory.
+    Files are sorted by name in reverse order (newest first).
+    """
+    # Create the export directory if it doesn't exist
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+
+    names = sorted(
+        (entry.name for entry in _iter_exports(EXPORT_DIR, recursive=False)),
+        reverse=True,
+    )
+
+    if not names:
+        print("No JSON exports found.")
+        return
+
+    print("Existing exports:")
+    for name in names:
+        print(f"  - {name}")
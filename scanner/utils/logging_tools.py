@@ -1,36 +1,74 @@
-import shutil
-from pathlib import Path
-from typing import Optional
-
-
-def clear_logs() -> None:
-    """
-    Remove all log files by deleting and recreating the logs directory.
-    """
-    logs_dir = Path("logs")
-    if logs_dir.exists():
-        shutil.rmtree(logs_dir)
-    logs_dir.mkdir(exist_ok=True)
-
-
-def show_logs(logfile: Optional[str] = None) -> str:
-    """
-    Read and return the content of the specified log file.
-
-    Args:
-        logfile: Optional log file name. Defaults to 'scanner.log' in 'logs/'.
-
-    Returns:
-        str: Contents of the log file or error message.
-    """
-    log_filename = logfile or "scanner.log"
-    log_path = Path("logs") / log_filename
-
-    if not log_path.exists():
-        return f"No log file found at {log_path}"
-
-    try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except Exception as e:
-        return f"Error reading log file: {str(e)}"
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+# Directory holding the log files, relative to the working directory.
+LOGS_DIR = Path("logs")
+
+# Log file used when no --logfile is given.
+DEFAULT_LOGFILE = "scanner.log"
+
+# Bytes read from the end of a log file by show_logs.
+DEFAULT_TAIL_BYTES = 64 * 1024
+
+
+def clear_logs() -> None:
+    """
+    Remove all log files, keeping the logs directory itself.
+
+    Log files are unlinked straight from one os.scandir pass; only
+    subdirectories, which the logger never creates, go through rmtree.
+    """
+    try:
+        entries = os.scandir(LOGS_DIR)
+    except FileNotFoundError:
+        LOGS_DIR.mkdir(exist_ok=True)
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def show_logs(
+    logfile: Optional[str] = None, tail_bytes: Optional[int] = DEFAULT_TAIL_BYTES
+) -> str:
+    """
+    Read and return the end of the specified log file.
+
+    Log files rotate at 10 MB, so only the last ``tail_bytes`` are read by
+    default instead of loading the whole file into memory. The first,
+    partial line of the window is dropped.
+
+    Args:
+        logfile: Optional log file name. Defaults to 'scanner.log' in 'logs/'.
+        tail_bytes: Size of the window read from the end of the file, or
+            None to read the whole file.
+
+    Returns:
+        str: Contents of the log file or error message.
+    """
+    log_path = LOGS_DIR / (logfile or DEFAULT_LOGFILE)
+
+    # Open directly instead of checking exists() first: one stat fewer, and
+    # no window for the file to disappear in between
+    try:
+        with open(log_path, "rb") as f:
+            if tail_bytes is not None:
+                size = f.seek(0, os.SEEK_END)
+                if size > tail_bytes:
+                    # Start one byte early so a window that begins exactly on
+                    # a line boundary keeps that line, then skip the cut line
+                    f.seek(size - tail_bytes - 1)
+                    f.readline()
+                else:
+                    f.seek(0)
+            return f.read().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return f"No log file found at {log_path}"
+    except Exception as e:
+        return f"Error reading log file: {str(e)}"
@@ -0,0 +1,52 @@
+import errno
+import functools
+import socket
+import time
+from typing import Tuple
+
+# Seconds a resolved address is reused before the host is looked up again.
+RESOLVE_TTL = 60.0
+
+Address = Tuple[int, str]
+
+# connect_ex() results meaning a non-blocking connect is still pending.
+# Windows reports WSAEWOULDBLOCK (10035), which is not errno.EWOULDBLOCK; the
+# literal fallback keeps the value in the set on every platform.
+CONNECT_PENDING = frozenset(
+    {
+        errno.EINPROGRESS,
+        errno.EWOULDBLOCK,
+        errno.EAGAIN,
+        getattr(errno, "WSAEWOULDBLOCK", 10035),
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(host: str, ttl_bucket: int) -> Address:
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    # Prefer IPv4: dual-stack hosts often list ::1 / AAAA first while the
+    # service only listens on IPv4, and only one address is probed
+    family, _, _, _, sockaddr = next(
+        (info for info in infos if info[0] == socket.AF_INET), infos[0]
+    )
+    return family, sockaddr[0]
+
+
+def resolve_host(host: str) -> Address:
+    """
+    Resolve a host to a stream address, IPv4 when it has one.
+
+    Results are memoized and reused for up to RESOLVE_TTL seconds, so the
+    TCP, HTTP and SSL scanners share one lookup per host.
+
+    Args:
+        host (str): IP address or domain name.
+
+    Returns:
+        Address: (address family, IP address string).
+
+    Raises:
+        socket.gaierror: If the host cannot be resolved.
+    """
+    return _resolve_cached(host, int(time.monotonic() // RESOLVE_TTL))
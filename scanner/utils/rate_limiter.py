@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from ..logging import log_with_context
+
+_LOGGER = logging.getLogger("sentinelpy")
+
+# Named pacing profiles: (seconds between probes, jitter enabled).
+PRESETS: Dict[str, Tuple[float, bool]] = {
+    "stealth": (1.0, True),
+    "normal": (0.05, False),
+    "aggressive": (0.01, False),
+}
+
+# Preset name that turns rate limiting off entirely.
+NO_LIMIT = "none"
+
+# Range of the random factor applied to waits when jitter is enabled.
+JITTER_RANGE = (0.5, 1.5)
+
+
+class RateLimiter:
+    """
+    Token-bucket pacing for outgoing probes.
+
+    Tokens refill lazily at one per ``delay`` seconds, computed from the
+    monotonic clock whenever a probe asks for one, so there is no refill
+    thread and no sleep at all while tokens are available. Probes that find
+    the bucket empty borrow against future refills and wait out the debt,
+    which keeps concurrent callers evenly spaced instead of waking together.
+
+    Safe to share between threads; coroutines use ``wait_async``.
+
+    Attributes:
+        delay (float): Seconds between probes at the sustained rate.
+        jitter (bool): Randomize each wait within JITTER_RANGE of its length.
+        burst (int): Probes that may go out back to back after an idle period.
+    """
+
+    def __init__(self, delay: float, jitter: bool = False, burst: int = 1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            delay (float): Seconds between probes; 0 disables pacing.
+            jitter (bool): Randomize waits to avoid a regular probe pattern.
+            burst (int): Bucket capacity, i.e. probes allowed without waiting.
+
+        Raises:
+            ValueError: If delay is negative or burst is less than 1.
+        """
+        if delay < 0:
+            raise ValueError(f"Delay cannot be negative, got {delay}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+
+        self.delay = delay
+        self.jitter = jitter
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_preset(cls, preset: str) -> Optional["RateLimiter"]:
+        """
+        Build a rate limiter from a named preset.
+
+        Args:
+            preset (str): One of PRESETS, or "none" to disable rate limiting.
+
+        Returns:
+            Optional[RateLimiter]: The limiter, or None for "none".
+
+        Raises:
+            ValueError: If the preset is unknown.
+        """
+        if preset == NO_LIMIT:
+            log_with_context(
+                _LOGGER,
+                logging.WARNING,
+                "Rate limiting DISABLED: probes are sent as fast as possible",
+                context="RATE",
+            )
+            return None
+
+        try:
+            delay, jitter = PRESETS[preset]
+        except KeyError:
+            choices = ", ".join([*PRESETS, NO_LIMIT])
+            raise ValueError(
+                f"Unknown rate limit preset '{preset}', expected one of: {choices}"
+            ) from None
+        return cls(delay, jitter=jitter)
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait before probing.
+
+        Returns:
+            float: Seconds to wait, 0.0 if a token was available.
+        """
+        if self.delay <= 0:
+            return 0.0
+
+        # Read the clock before taking the lock so the critical section is
+        # plain arithmetic; a thread that read it slightly earlier than the
+        # last holder simply gets no refill.
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last
+            if elapsed > 0:
+                self._tokens = min(self.burst, self._tokens + elapsed / self.delay)
+                self._last = now
+            self._tokens -= 1
+            debt = -self._tokens
+
+        if debt <= 0:
+            return 0.0
+
+        pause = debt * self.delay
+        if self.jitter:
+            pause *= random.uniform(*JITTER_RANGE)
+        return pause
+
+    def wait(self) -> None:
+        """Block until the next probe may be sent."""
+        pause = self.reserve()
+        if pause > 0:
+            time.sleep(pause)
+
+    async def wait_async(self) -> None:
+        """Suspend the calling coroutine until the next probe may be sent."""
+        pause = self.reserve()
+        if pause > 0:
+            await asyncio.sleep(pause)
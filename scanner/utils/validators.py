@@ -1,47 +1,102 @@
-from typing import Tuple
-
-from ..exceptions import PortRangeError
-
-
-def validate_port(port: int) -> bool:
-    """
-    Validates if a port number is within the valid range (1-65535).
-
-    Args:
-        port (int): Port number to validate.
-
-    Returns:
-        bool: True if port is valid, False otherwise.
-    """
-    return 1 <= port <= 65535
-
-
-def parse_port_range(ports_range: str) -> Tuple[int, int]:
-    """
-    Parse and validate a port range string.
-
-    Args:
-        ports_range (str): Port range in the format 'start-end' (e.g., '20-80').
-
-    Returns:
-        Tuple[int, int]: Start and end ports.
-
-    Raises:
-        PortRangeError: If the port range is invalid.
-    """
-    try:
-        start, end = map(int, ports_range.split("-"))
-    except ValueError:
-        raise PortRangeError("Invalid port range format. Use the format '20-80'.")
-
-    if not (validate_port(start) and validate_port(end)):
-        raise PortRangeError(
-            f"Ports must be between 1 and 65535. Got range: {start}-{end}"
-        )
-
-    if start > end:
-        raise PortRangeError(
-            f"Start port ({start}) cannot be greater than end port ({end})"
-        )
-
-    return start, end
+from typing import Iterable, Sequence, Tuple, Union
+
+from ..exceptions import PortRangeError
+
+PortsSpec = Union[str, range, Iterable[int]]
+
+
+def validate_port(port: int) -> bool:
+    """
+    Validates if a port number is within the valid range (1-65535).
+
+    Args:
+        port (int): Port number to validate.
+
+    Returns:
+        bool: True if port is valid, False otherwise.
+    """
+    return 1 <= port <= 65535
+
+
+def _check_range(start: int, end: int) -> None:
+    """
+    Ensure 1 <= start <= end <= 65535.
+
+    Valid ranges pass a single comparison chain; the individual checks only
+    run to pick the error message.
+
+    Raises:
+        PortRangeError: If either port is out of bounds or start > end.
+    """
+    if 1 <= start <= end <= 65535:
+        return
+    if not (validate_port(start) and validate_port(end)):
+        raise PortRangeError(
+            f"Ports must be between 1 and 65535. Got range: {start}-{end}"
+        )
+    raise PortRangeError(
+        f"Start port ({start}) cannot be greater than end port ({end})"
+    )
+
+
+def parse_port_range(ports_range: str) -> Tuple[int, int]:
+    """
+    Parse and validate a port range string.
+
+    Args:
+        ports_range (str): Port range in the format 'start-end' (e.g., '20-80').
+
+    Returns:
+        Tuple[int, int]: Start and end ports.
+
+    Raises:
+        PortRangeError: If the port range is invalid.
+    """
+    # Split on the dash instead of matching a regex; isascii() keeps out
+    # non-ASCII digits that isdigit() would accept
+    first, _, last = ports_range.partition("-")
+    if not (
+        ports_range.isascii()
+        and first.isdigit()
+        and last.isdigit()
+        and len(first) <= 5
+        and len(last) <= 5
+    ):
+        raise PortRangeError("Invalid port range format. Use the format '20-80'.")
+    start, end = int(first), int(last)
+    _check_range(start, end)
+    return start, end
+
+
+def normalize_ports(ports: PortsSpec) -> Sequence[int]:
+    """
+    Turn any supported port specification into a sequence of ports.
+
+    Only a 'start-end' string or a range describes a span of ports. Any
+    other iterable, tuples included, lists individual ports: (22, 80) scans
+    ports 22 and 80, not 22 through 80.
+
+    Args:
+        ports: A 'start-end' string, a range, or an iterable of port numbers.
+
+    Returns:
+        Sequence[int]: Ports to scan, in order.
+
+    Raises:
+        PortRangeError: If the specification is invalid.
+    """
+    if isinstance(ports, str):
+        start, end = parse_port_range(ports)
+        return range(start, end + 1)
+
+    if isinstance(ports, range) and ports.step == 1:
+        _check_range(ports.start, ports.stop - 1)
+        return ports
+
+    ports = list(ports)
+    # Same bounds as validate_port, inlined: a call per port costs more than
+    # the comparison itself on full-range lists
+    invalid = [port for port in ports if not 1 <= port <= 65535]
+    if invalid:
+        raise PortRangeError(f"Ports must be between 1 and 65535. Got: {invalid}")
+    return ports
@@ -1,21 +1,45 @@
-# tests/test_cli_parser.py
-from scanner.cli.parser import parse_args
-
-
-def test_parse_minimal():
-    """Basic parse: host + port-range only."""
-    ns = parse_args(["localhost", "20-30"])
-    assert ns.host == "localhost"
-    # validate tuple conversion after custom validation
-    assert ns.ports == (20, 30)
-    # default timeout should remain unchanged
-    assert ns.timeout == 0.5
-
-
-def test_parse_json_flag(tmp_path):
-    """Parse with --json flag; ensure file path and port tuple are captured."""
-    json_file = tmp_path / "out.json"
-    ns = parse_args(["127.0.0.1", "80-80", "--json", str(json_file)])
-
-    assert ns.json == str(json_file)  # CLI stores the provided filename
-    assert ns.ports == (80, 80)  # tuple after validation
+# tests/test_cli_parser.py
+from scanner.cli.parser import parse_args
+
+
+def test_parse_minimal():
+    """Basic parse: host + port-range only."""
+    ns = parse_args(["localhost", "20-30"])
+    assert ns.host == "localhost"
+    # validate tuple conversion after custom validation
+    assert ns.ports == (20, 30)
+    # default timeout should remain unchanged
+    assert ns.timeout == 0.5
+
+
+def test_parse_json_flag(tmp_path):
+    """Parse with --json flag; ensure file path and port tuple are captured."""
+    json_file = tmp_path / "out.json"
+    ns = parse_args(["127.0.0.1", "80-80", "--json", str(json_file)])
+
+    assert ns.json == str(json_file)  # CLI stores the provided filename
+    assert ns.ports == (80, 80)  # tuple after validation
+
+
+def test_parse_clear_logs_without_target():
+    """--clear-logs alone is accepted without host and port range."""
+    ns = parse_args(["--clear-logs"])
+    assert ns.clear_logs is True
+
+
+def test_parse_utility_only_has_run_defaults():
+    """Utility-only invocations still expose the options the run path reads."""
+    ns = parse_args(["--list-exports"])
+    assert ns.show_logs is False
+    assert ns.logfile is None
+
+
+def test_parse_rate_limit_options():
+    """Rate limiting is off unless --preset or --delay is given."""
+    ns = parse_args(["localhost", "80-80"])
+    assert ns.preset is None
+    assert ns.delay is None
+
+    ns = parse_args(["localhost", "80-80", "--preset", "stealth", "--delay", "0.5"])
+    assert ns.preset == "stealth"
+    assert ns.delay == 0.5
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from scanner.utils.exporter import (
+    clean_exports,
+    list_exports,
+    print_json,
+    safe_filename,
+    write_json,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {
+            "tcp": {
+                "open_ports": [80],
+                "scan_results": [{"port": 80, "status": "open", "service": "http"}],
+            },
+            "ssl": {"ok": False, "error": "Socket error"},
+        },
+        {},
+        [1, 2],
+    ],
+)
+def test_write_json_matches_stdlib_layout(tmp_path, monkeypatch, data):
+    """With the stdlib encoder, streamed output is byte-identical to json.dumps."""
+    monkeypatch.setattr("scanner.utils.exporter.ORJSON_AVAILABLE", False)
+    path = tmp_path / "out.json"
+    write_json(data, path)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2)
+
+
+def test_print_json(capsys):
+    data = {"tcp": {"open_ports": [22], "scan_results": []}}
+    print_json(data)
+
+    assert capsys.readouterr().out == json.dumps(data, indent=2) + "\n"
+
+
+def test_clean_and_list_exports(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("scanner.utils.exporter.EXPORT_DIR", tmp_path)
+    (tmp_path / "nested").mkdir()
+    for name in ("scan_a.json", "scan_b.json", "notes.txt", "nested/old.json"):
+        (tmp_path / name).write_text("{}")
+
+    list_exports()
+    assert capsys.readouterr().out.splitlines() == [
+        "Existing exports:",
+        "  - scan_b.json",
+        "  - scan_a.json",
+    ]
+
+    clean_exports()
+    assert capsys.readouterr().out == "3 JSON file(s) deleted.\n"
+    assert sorted(p.name for p in tmp_path.rglob("*") if p.is_file()) == ["notes.txt"]
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("scan_2024-01.json", "scan_2024-01.json"),
+        ("../my scan", ".._my_scan"),
+        ("résumé:1", "r_sum__1"),
+    ],
+)
+def test_safe_filename(name, expected):
+    assert safe_filename(name) == expected
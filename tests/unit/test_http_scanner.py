@@ -1,37 +1,251 @@
-from unittest.mock import MagicMock, patch
-
-from scanner.core.http import HTTPScanner
-
-
-@patch("scanner.core.http.requests.get")
-def test_http_scanner_success(mock_get):
-    """Test HTTPScanner when server replies 200 OK."""
-    # Setup mock response
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.headers = {"Server": "MockServer", "Content-Type": "text/html"}
-    mock_response.ok = True
-    mock_get.return_value = mock_response
-
-    scanner = HTTPScanner(timeout=1)
-    result = scanner.scan("testserver.com", [8080])
-
-    assert result["open_ports"] == [8080]
-    assert len(result["scan_results"]) == 1
-    assert result["scan_results"][0]["status_code"] == 200
-    assert result["scan_results"][0]["server"] == "Mockserver"
-    assert result["scan_results"][0]["url"] == "http://testserver.com:8080/"
-
-
-@patch("scanner.core.http.requests.get")
-def test_http_scanner_error(mock_get):
-    """Test HTTPScanner handles request exceptions."""
-    mock_get.side_effect = Exception("Timeout or connection error")
-
-    scanner = HTTPScanner(timeout=1)
-    result = scanner.scan("badhost", [1234])
-
-    assert result["open_ports"] == []
-    assert len(result["scan_results"]) == 1
-    assert "error" in result["scan_results"][0]
-    assert result["scan_results"][0]["url"] == "http://badhost:1234/"
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scanner.core.http import HTTPScanner
+
+
+@pytest.fixture(autouse=True)
+def offline_resolver():
+    """Keep scans off the network: names do not resolve unless a test says so."""
+    with patch(
+        "scanner.core.http.resolve_host", side_effect=socket.gaierror("offline")
+    ) as mock_resolve:
+        yield mock_resolve
+
+
+@patch("scanner.core.http.requests.Session.head")
+def test_http_scanner_success(mock_head):
+    """Test HTTPScanner when server replies 200 OK."""
+    # Setup mock response
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {"Server": "MockServer", "Content-Type": "text/html"}
+    mock_response.ok = True
+    mock_head.return_value = mock_response
+
+    scanner = HTTPScanner(timeout=1)
+    result = scanner.scan("testserver.com", [8080])
+
+    assert result["open_ports"] == [8080]
+    assert len(result["scan_results"]) == 1
+    assert result["scan_results"][0]["status_code"] == 200
+    assert result["scan_results"][0]["server"] == "Mockserver"
+    assert result["scan_results"][0]["url"] == "http://testserver.com:8080/"
+
+
+@patch("scanner.core.http.requests.Session.head")
+def test_http_scanner_error(mock_head):
+    """Test HTTPScanner handles request exceptions."""
+    mock_head.side_effect = Exception("Timeout or connection error")
+
+    scanner = HTTPScanner(timeout=1)
+    result = scanner.scan("badhost", [1234])
+
+    assert result["open_ports"] == []
+    assert len(result["scan_results"]) == 1
+    assert "error" in result["scan_results"][0]
+    assert result["scan_results"][0]["url"] == "http://badhost:1234/"
+
+
+@patch("scanner.core.http.requests.Session.head")
+def test_http_scanner_keeps_port_order(mock_head):
+    """Results follow the requested port order even though probes run concurrently."""
+
+    def fake_head(url, headers, timeout, allow_redirects):
+        if url.endswith(":80/"):
+            return MagicMock(status_code=200, headers={"Server": "nginx"})
+        raise Exception("Connection refused")
+
+    mock_head.side_effect = fake_head
+
+    scanner = HTTPScanner(timeout=1)
+    result = scanner.scan("testserver.com", [8080, 80, 81])
+
+    assert result["open_ports"] == [80]
+    assert [r["port"] for r in result["scan_results"]] == [8080, 80, 81]
+    assert result["scan_results"][1]["server"] == "Nginx"
+
+
+@patch("scanner.core.http.requests.Session.head")
+def test_http_scanner_accepts_range(mock_head):
+    mock_head.side_effect = Exception("Connection refused")
+
+    result = HTTPScanner(timeout=1).scan("testserver.com", range(8000, 8003))
+
+    assert [r["port"] for r in result["scan_results"]] == [8000, 8001, 8002]
+
+
+@patch("scanner.core.http.requests.Session.get")
+@patch("scanner.core.http.requests.Session.head")
+def test_http_scanner_head_fallback(mock_head, mock_get):
+    """Servers rejecting HEAD are probed again with GET."""
+    mock_head.return_value = MagicMock(status_code=405, headers={})
+    mock_get.return_value = MagicMock(
+        status_code=404, headers={"Server": "Apache/2.4.41"}
+    )
+
+    scanner = HTTPScanner(timeout=1)
+    result = scanner.scan("testserver.com", [8080])
+
+    mock_get.assert_called_once()
+    assert result["open_ports"] == [8080]
+    assert result["scan_results"][0]["status_code"] == 404
+    assert result["scan_results"][0]["server"] == "Apache"
+
+
+@patch("scanner.core.http.requests.Session.head")
+def test_http_scanner_resolves_once(mock_head, offline_resolver):
+    """Probes connect to the resolved address and name the host in Host."""
+    offline_resolver.side_effect = None
+    offline_resolver.return_value = (socket.AF_INET, "192.0.2.10")
+    mock_head.return_value = MagicMock(status_code=200, headers={})
+
+    scanner = HTTPScanner(timeout=1)
+    result = scanner.scan("testserver.com", [80, 8080])
+
+    offline_resolver.assert_called_once_with("testserver.com")
+    requested = {
+        call.args[0]: call.kwargs["headers"]["Host"]
+        for call in mock_head.call_args_list
+    }
+    assert requested == {
+        "http://192.0.2.10:80/": "testserver.com",
+        "http://192.0.2.10:8080/": "testserver.com:8080",
+    }
+    assert result["scan_results"][1]["url"] == "http://testserver.com:8080/"
+
+
+def test_http_scanner_unknown_backend():
+    with pytest.raises(ValueError):
+        HTTPScanner(backend="raw")
+
+
+@patch("scanner.core.http.requests.Session.close")
+def test_http_scanner_context_closes_session(mock_close):
+    with HTTPScanner() as scanner:
+        assert isinstance(scanner, HTTPScanner)
+        mock_close.assert_not_called()
+
+    mock_close.assert_called_once_with()
+
+
+@patch("scanner.core.http.AIOHTTP_AVAILABLE", False)
+def test_http_scanner_asyncio_requires_aiohttp():
+    with pytest.raises(ImportError):
+        HTTPScanner(backend="asyncio")
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("Apache/2.4.41 (Ubuntu)", "Apache"),
+        ("nginx/1.18.0", "Nginx"),
+        ("Microsoft-IIS/10.0", "Microsoft IIS"),
+        ("LiteSpeed", "Litespeed"),
+        ("", "Unknown"),
+    ],
+)
+def test_identify_web_server(header, expected):
+    assert HTTPScanner()._identify_web_server(header) == expected
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers HEAD and GET, recording the methods it was asked for."""
+
+    sys_version = ""
+    requests = []
+    head_status = 200
+
+    def _reply(self, status):
+        type(self).requests.append(self.command)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._reply(self.head_status)
+
+    def do_GET(self):
+        self._reply(200)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Start HTTP servers on loopback; yields a factory returning their ports."""
+    servers = []
+
+    def start(server_version, head_status=200):
+        handler = type(
+            "Handler",
+            (_Handler,),
+            {
+                "server_version": server_version,
+                "head_status": head_status,
+                "requests": [],
+            },
+        )
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        # A short poll interval keeps shutdown() from stalling teardown
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        servers.append(server)
+        return server.server_address[1], handler
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("backend", ["thread", "asyncio"])
+def test_http_scanner_against_local_servers(local_server, backend):
+    if backend == "asyncio":
+        pytest.importorskip("aiohttp")
+
+    nginx_port, nginx = local_server("nginx/1.25")
+    # Rejects HEAD, so the scanner has to ask again with GET
+    apache_port, apache = local_server("Apache/2.4", head_status=405)
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        closed_port = unused.getsockname()[1]
+
+        scanner = HTTPScanner(timeout=2, backend=backend)
+        result = scanner.scan("127.0.0.1", [apache_port, closed_port, nginx_port])
+
+    assert result["open_ports"] == [apache_port, nginx_port]
+    apache_entry, closed_entry, nginx_entry = result["scan_results"]
+
+    assert nginx_entry["status_code"] == 200
+    assert nginx_entry["server"] == "Nginx"
+    assert nginx_entry["content_type"] == "text/plain"
+    assert nginx.requests == ["HEAD"]
+
+    assert apache_entry["status_code"] == 200
+    assert apache_entry["server"] == "Apache"
+    assert apache.requests == ["HEAD", "GET"]
+
+    assert closed_entry["status"] == "closed"
+    assert closed_entry["url"] == f"http://127.0.0.1:{closed_port}/"
+    assert closed_entry["error"]
+
+
+def test_http_scanner_async_backend_paces_probes(local_server):
+    pytest.importorskip("aiohttp")
+
+    port, _ = local_server("nginx")
+    rate_limiter = MagicMock()
+    rate_limiter.wait_async = AsyncMock()
+
+    scanner = HTTPScanner(timeout=2, backend="asyncio", rate_limiter=rate_limiter)
+    result = scanner.scan("127.0.0.1", [port])
+
+    assert result["open_ports"] == [port]
+    rate_limiter.wait_async.assert_awaited_once()
+    rate_limiter.wait.assert_not_called()
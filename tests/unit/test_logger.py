@@ -0,0 +1,67 @@
+import atexit
+import logging
+import queue
+import sys
+
+import pytest
+
+import scanner.logging.logger as logger_module
+from scanner.logging import flush_logs, log_with_context, setup_logger
+from scanner.logging.logger import _FileQueueHandler
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    """Set up a fresh sentinelpy logger writing under tmp_path."""
+    monkeypatch.setattr(logger_module, "LOGS_DIR", tmp_path)
+    log = logging.getLogger("sentinelpy")
+    saved = log.handlers[:]
+    log.handlers.clear()
+    yield setup_logger("test.log")
+    listener = logger_module._listener
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in log.handlers:
+        handler.close()
+    log.handlers[:] = saved
+
+
+def test_file_queue_handler_keeps_exc_info():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord(
+        "sentinelpy", logging.ERROR, __file__, 1, "Failed on %s", ("host",), exc_info
+    )
+
+    prepared = _FileQueueHandler(queue.Queue()).prepare(record)
+
+    # Arguments are merged, but the traceback is left to the file formatter
+    assert prepared.msg == "Failed on host" and prepared.args is None
+    assert prepared.exc_info is exc_info
+    assert record.args == ("host",)
+
+
+def test_file_log_keeps_traceback(logger, tmp_path):
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        log_with_context(
+            logger, logging.ERROR, "Failed on %s", "host", context="SCAN", exc_info=True
+        )
+    flush_logs()
+
+    content = (tmp_path / "test.log").read_text(encoding="utf-8")
+    assert "ERROR    | [SCAN] Failed on host" in content
+    assert "Traceback (most recent call last)" in content
+    assert "ZeroDivisionError" in content
+
+
+def test_console_log_is_synchronous(logger, capsys):
+    log_with_context(logger, logging.INFO, "before")
+    print("output")
+    log_with_context(logger, logging.INFO, "after")
+
+    out = capsys.readouterr().out
+    assert out.index("before") < out.index("output") < out.index("after")
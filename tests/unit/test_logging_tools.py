@@ -0,0 +1,35 @@
+from scanner.utils.logging_tools import clear_logs, show_logs
+
+
+def test_show_logs_missing_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    message = show_logs("absent.log")
+    assert message.startswith("No log file found") and "absent.log" in message
+
+
+def test_show_logs_reads_tail(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    lines = [f"line {i}\n" for i in range(100)]
+    (tmp_path / "logs" / "scan.log").write_bytes("".join(lines).encode())
+
+    # The window starts mid-line; the partial line is dropped
+    assert show_logs("scan.log", tail_bytes=20) == "line 98\nline 99\n"
+    # A window starting on a line boundary keeps that line
+    assert show_logs("scan.log", tail_bytes=24) == "line 97\nline 98\nline 99\n"
+
+    assert show_logs("scan.log", tail_bytes=None) == "".join(lines)
+    assert show_logs("scan.log") == "".join(lines)
+
+
+def test_clear_logs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    clear_logs()
+    assert (tmp_path / "logs").is_dir()
+
+    (tmp_path / "logs" / "archive").mkdir()
+    for name in ("scanner.log", "scanner.log.1", "archive/old.log"):
+        (tmp_path / "logs" / name).write_text("entry\n")
+
+    clear_logs()
+    assert list((tmp_path / "logs").iterdir()) == []
@@ -0,0 +1,37 @@
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+
+from scanner.modules import create_rate_limiter, run_selected_modules
+
+
+@pytest.mark.parametrize(
+    "delay,preset,expected_delay,expected_jitter",
+    [
+        (None, "stealth", 1.0, True),
+        (None, "aggressive", 0.01, False),
+        # An explicit delay overrides the preset, jitter included
+        (0.2, "stealth", 0.2, False),
+    ],
+)
+def test_create_rate_limiter(delay, preset, expected_delay, expected_jitter):
+    limiter = create_rate_limiter(Namespace(delay=delay, preset=preset))
+    assert limiter.delay == expected_delay
+    assert limiter.jitter is expected_jitter
+
+
+@pytest.mark.parametrize("preset", [None, "none"])
+def test_create_rate_limiter_disabled(preset):
+    assert create_rate_limiter(Namespace(delay=None, preset=preset)) is None
+
+
+@patch("scanner.modules.TCPScanner")
+def test_run_selected_modules_defaults_to_tcp(mock_tcp_class):
+    mock_tcp_class.return_value.scan.return_value = {"open_ports": [22]}
+    args = Namespace(host="localhost", ports=(20, 25), timeout=0.5, modules=None)
+
+    results = run_selected_modules(args, logger=None)
+
+    assert results == {"tcp": {"open_ports": [22]}}
+    mock_tcp_class.return_value.scan.assert_called_once_with("localhost", range(20, 26))
@@ -0,0 +1,21 @@
+import socket
+from unittest.mock import patch
+
+from scanner.utils.network import _resolve_cached, resolve_host
+
+
+@patch("scanner.utils.network.socket.getaddrinfo")
+def test_resolve_prefers_ipv4(mock_getaddrinfo):
+    stream = socket.SOCK_STREAM
+    mock_getaddrinfo.return_value = [
+        (socket.AF_INET6, stream, 6, "", ("::1", 0, 0, 0)),
+        (socket.AF_INET, stream, 6, "", ("127.0.0.1", 0)),
+    ]
+    _resolve_cached.cache_clear()
+
+    assert resolve_host("dual.example") == (socket.AF_INET, "127.0.0.1")
+
+    # IPv6-only hosts still resolve
+    mock_getaddrinfo.return_value = mock_getaddrinfo.return_value[:1]
+    assert resolve_host("v6only.example") == (socket.AF_INET6, "::1")
+    _resolve_cached.cache_clear()
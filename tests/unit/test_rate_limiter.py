@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+import pytest
+
+from scanner.utils.rate_limiter import JITTER_RANGE, RateLimiter
+
+
+@patch("scanner.utils.rate_limiter.time.monotonic", return_value=100.0)
+def test_reserve_paces_back_to_back_probes(mock_monotonic):
+    limiter = RateLimiter(delay=0.1)
+
+    # The first probe uses the initial token, the next ones queue behind it
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1)
+    assert limiter.reserve() == pytest.approx(0.2)
+
+
+@patch("scanner.utils.rate_limiter.time.monotonic")
+def test_reserve_refills_lazily(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(delay=0.1, burst=3)
+
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.1)
+
+    # Idle long enough to refill the whole bucket, but never beyond it
+    mock_monotonic.return_value = 200.0
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.1)
+
+
+@patch("scanner.utils.rate_limiter.time.monotonic", return_value=100.0)
+def test_reserve_jitter(mock_monotonic):
+    limiter = RateLimiter(delay=0.1, jitter=True)
+    limiter.reserve()
+
+    low, high = JITTER_RANGE
+    pause = limiter.reserve()
+    assert 0.1 * low <= pause <= 0.1 * high
+
+
+def test_zero_delay_never_waits():
+    limiter = RateLimiter(delay=0)
+    assert [limiter.reserve() for _ in range(5)] == [0.0] * 5
+
+
+@patch("scanner.utils.rate_limiter.time.sleep")
+@patch("scanner.utils.rate_limiter.time.monotonic", return_value=100.0)
+def test_wait_sleeps_only_when_needed(mock_monotonic, mock_sleep):
+    limiter = RateLimiter(delay=0.1)
+
+    limiter.wait()
+    mock_sleep.assert_not_called()
+
+    limiter.wait()
+    mock_sleep.assert_called_once_with(pytest.approx(0.1))
+
+
+@pytest.mark.parametrize(
+    "preset,delay,jitter",
+    [("stealth", 1.0, True), ("normal", 0.05, False), ("aggressive", 0.01, False)],
+)
+def test_from_preset(preset, delay, jitter):
+    limiter = RateLimiter.from_preset(preset)
+    assert limiter.delay == delay
+    assert limiter.jitter is jitter
+
+
+def test_from_preset_none_disables_limiting():
+    assert RateLimiter.from_preset("none") is None
+
+
+def test_from_preset_unknown():
+    with pytest.raises(ValueError):
+        RateLimiter.from_preset("turbo")
+
+
+@pytest.mark.parametrize("kwargs", [{"delay": -1}, {"delay": 0.1, "burst": 0}])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
+
+
+@patch("scanner.utils.rate_limiter.time.monotonic")
+def test_reserve_tolerates_stale_clock_reads(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(delay=0.1)
+    limiter.reserve()
+
+    # A thread that read the clock before the previous holder still pays
+    # its share instead of corrupting the bucket
+    mock_monotonic.return_value = 99.9
+    assert limiter.reserve() == pytest.approx(0.1)
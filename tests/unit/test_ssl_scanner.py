@@ -0,0 +1,160 @@
+import socket
+import ssl
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scanner.core.ssl import SSLScanner
+
+# Self-signed certificate and key for CN=sentinelpy-test, valid until 2126,
+# with localhost and 127.0.0.1 as subject alternative names
+TEST_CERT = Path(__file__).parent / "data" / "localhost.pem"
+
+
+@pytest.fixture(scope="module")
+def ssl_scanner():
+    # Only used for stateless helpers, so one instance serves every test
+    return SSLScanner()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (
+            "Jun  1 12:00:00 2025 GMT",
+            datetime(2025, 6, 1, 12, 0, 0, tzinfo=timezone.utc),
+        ),
+        (
+            "Dec 31 23:59:59 2030 GMT",
+            datetime(2030, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_parse_dt(ssl_scanner, value, expected):
+    assert ssl_scanner._parse_dt(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "Foo  1 12:00:00 2025 GMT", "Jun 1 2025"])
+def test_parse_dt_invalid(ssl_scanner, value):
+    assert ssl_scanner._parse_dt(value) is None
+
+
+@patch("scanner.core.ssl.resolve_host")
+def test_scan_many_reports_each_target(mock_resolve):
+    def resolve(host):
+        if host == "nope.invalid":
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return socket.AF_INET, "127.0.0.1"
+
+    mock_resolve.side_effect = resolve
+
+    # Accepts connections but never answers the TLS handshake
+    silent = socket.socket()
+    silent.bind(("127.0.0.1", 0))
+    silent.listen()
+    # Nothing listens here any more, so the connect is refused
+    with socket.socket() as closed:
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+
+    with silent:
+        results = SSLScanner(timeout=0.2).scan_many(
+            [
+                ("nope.invalid", 443),
+                ("localhost", silent.getsockname()[1]),
+                ("localhost", closed_port),
+            ]
+        )
+
+    assert [r["ok"] for r in results] == [False, False, False]
+    assert "Name or service not known" in results[0]["error"]
+    assert results[1]["error"] == "Socket error: timed out"
+    assert "Connection refused" in results[2]["error"]
+
+
+@pytest.fixture
+def tls_server():
+    """Serve one TLS handshake on loopback with the test certificate."""
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(TEST_CERT)
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+
+    def serve():
+        conn, _ = listener.accept()
+        # Answer late so the client's first handshake step has to wait for data
+        time.sleep(0.05)
+        try:
+            with ctx.wrap_socket(conn, server_side=True) as tls:
+                tls.recv(1)  # Returns once the client hangs up
+        except OSError:
+            pass
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    with listener:
+        yield listener.getsockname()[1]
+        thread.join(timeout=2)
+
+
+def test_scan_completes_handshake(tls_server):
+    scanner = SSLScanner(timeout=2.0)
+    # Trust the self-signed test certificate instead of the system roots
+    scanner._ctx = ssl.create_default_context(cafile=str(TEST_CERT))
+
+    result = scanner.scan("127.0.0.1", tls_server)
+
+    assert result["ok"] is True
+    assert result["issued_to"] == "sentinelpy-test"
+    assert result["issued_by"] == "sentinelpy-test"
+    assert result["valid_until"].startswith("2126-")
+    assert result["expired"] is False
+    assert result["days_left"] > 36000
+
+
+@patch("scanner.core.ssl.NameOID", create=True)
+@patch("scanner.core.ssl.x509", create=True)
+def test_der_result(mock_x509, mock_name_oid, ssl_scanner):
+    cert = mock_x509.load_der_x509_certificate.return_value
+    cert.subject.get_attributes_for_oid.return_value = [MagicMock(value="example.com")]
+    cert.issuer.get_attributes_for_oid.return_value = []
+    cert.not_valid_before_utc = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    cert.not_valid_after_utc = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+    result = ssl_scanner._der_result(b"der")
+
+    mock_x509.load_der_x509_certificate.assert_called_once_with(b"der")
+    assert result["ok"] is True
+    assert result["issued_to"] == "example.com"
+    assert result["issued_by"] is None
+    assert result["valid_until"] == "2021-01-01T00:00:00+00:00"
+    assert result["expired"] is True
+
+
+@patch("scanner.core.ssl.NameOID", create=True)
+@patch("scanner.core.ssl.x509", create=True)
+def test_der_result_old_cryptography(mock_x509, mock_name_oid, ssl_scanner):
+    # cryptography < 42: no *_utc attributes, naive datetimes in UTC
+    cert = MagicMock(spec=["subject", "issuer", "not_valid_before", "not_valid_after"])
+    cert.subject.get_attributes_for_oid.return_value = []
+    cert.issuer.get_attributes_for_oid.return_value = []
+    cert.not_valid_before = datetime(2020, 1, 1)
+    cert.not_valid_after = datetime(2021, 1, 1)
+    mock_x509.load_der_x509_certificate.return_value = cert
+
+    result = ssl_scanner._der_result(b"der")
+
+    assert result["ok"] is True
+    assert result["valid_until"] == "2021-01-01T00:00:00+00:00"
+    assert result["expired"] is True
+
+
+def test_der_result_without_certificate(ssl_scanner):
+    result = ssl_scanner._der_result(None)
+    assert result["ok"] is False
+    assert result["error"] == "No certificate presented"
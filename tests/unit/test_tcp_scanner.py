@@ -1,31 +1,201 @@
-from unittest.mock import MagicMock, patch
-
-from scanner.core.tcp import TCPScanner
-
-
-@patch("scanner.core.tcp.socket.socket")
-def test_scan_ports_open(mock_socket_class):
-    mock_socket = MagicMock()
-    mock_socket.connect_ex.return_value = 0
-    mock_socket_class.return_value.__enter__.return_value = mock_socket
-
-    scanner = TCPScanner(timeout=0.1)
-    result = scanner.scan("127.0.0.1", "80-80")
-
-    assert 80 in result["open_ports"]
-    assert result["scan_results"][0]["status"] == "open"
-    assert result["scan_results"][0]["port"] == 80
-
-
-@patch("scanner.core.tcp.socket.socket")
-def test_scan_ports_closed(mock_socket_class):
-    mock_socket = MagicMock()
-    mock_socket.connect_ex.return_value = 1
-    mock_socket_class.return_value.__enter__.return_value = mock_socket
-
-    scanner = TCPScanner()
-    result = scanner.scan("127.0.0.1", "81-81")
-
-    assert 81 not in result["open_ports"]
-    assert result["scan_results"][0]["status"] == "closed"
-    assert result["scan_results"][0]["port"] == 81
+import asyncio
+import errno
+import socket
+from asyncio.selector_events import BaseSelectorEventLoop
+from unittest.mock import patch
+
+import pytest
+
+from scanner.core.tcp import BACKENDS, MAX_CONCURRENCY, TCPScanner, _service_name
+from scanner.exceptions import HostResolutionError, HostUnreachableError
+
+
+class FakeSocket:
+    """Non-blocking socket whose connect finishes at once with a fixed result."""
+
+    def __init__(self, result=0):
+        self.result = result
+        self.connects = 0
+        self.closes = 0
+
+    def setblocking(self, flag):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect_ex(self, address):
+        self.connects += 1
+        return self.result
+
+    def close(self):
+        self.closes += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PendingSocket(FakeSocket):
+    """
+    Socket whose connect reports "in progress"; one end of a connected
+    socketpair answers the selector and the SO_ERROR lookup.
+    """
+
+    def __init__(self, result):
+        super().__init__(result)
+        self._sock, self._peer = socket.socketpair()
+
+    def fileno(self):
+        return self._sock.fileno()
+
+    def getsockopt(self, *args):
+        return self._sock.getsockopt(*args)
+
+    def close(self):
+        super().close()
+        self._sock.close()
+        self._peer.close()
+
+
+def assert_single_port(result, port, status):
+    """Check the result of a scan over the single given port."""
+    (entry,) = result["scan_results"]
+    assert (entry["port"], entry["status"]) == (port, status)
+    assert (port in result["open_ports"]) == (status == "open")
+
+
+@pytest.fixture
+def fake_socket(monkeypatch):
+    """Make every socket a scan opens the same FakeSocket."""
+    sock = FakeSocket()
+    monkeypatch.setattr("scanner.core.tcp.socket.socket", lambda *args: sock)
+    return sock
+
+
+def test_scan_ports_open(fake_socket):
+    result = TCPScanner(timeout=0.1).scan("127.0.0.1", "80-80")
+
+    assert_single_port(result, 80, "open")
+    assert fake_socket.closes == 1
+
+
+def test_scan_ports_closed(fake_socket):
+    fake_socket.result = errno.ECONNREFUSED
+    result = TCPScanner().scan("127.0.0.1", "81-81")
+
+    assert_single_port(result, 81, "closed")
+
+
+def test_scan_unreachable_host(fake_socket):
+    fake_socket.result = errno.ENETUNREACH
+    with pytest.raises(HostUnreachableError):
+        TCPScanner(timeout=0.1).scan("10.255.255.1", "1-2000")
+
+    # Gave up after the first batch
+    assert fake_socket.connects == MAX_CONCURRENCY
+
+
+def test_scan_threaded_unreachable_host(fake_socket):
+    fake_socket.result = errno.ENETUNREACH
+    with pytest.raises(HostUnreachableError):
+        TCPScanner(timeout=0.1, backend="thread").scan("10.255.255.1", "1-10")
+
+
+def test_scan_async_unreachable_host(monkeypatch):
+    async def unreachable(self, sock, address):
+        raise OSError(errno.ENETUNREACH, "Network is unreachable")
+
+    monkeypatch.setattr(BaseSelectorEventLoop, "sock_connect", unreachable)
+    with pytest.raises(HostUnreachableError):
+        TCPScanner(timeout=0.1, backend="asyncio").scan("10.255.255.1", "1-10")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_scan_reports_socket_errors(monkeypatch, backend):
+    real_socket = socket.socket
+
+    def no_sockets(family=-1, type=-1, proto=-1, fileno=None):
+        # asyncio still needs to wrap the socketpair it wakes its loop with
+        if fileno is not None:
+            return real_socket(family, type, proto, fileno)
+        raise OSError(errno.EMFILE, "Too many open files")
+
+    monkeypatch.setattr("scanner.core.tcp.socket.socket", no_sockets)
+    result = TCPScanner(backend=backend).scan("127.0.0.1", "80-80")
+
+    assert result["scan_results"][0]["status"] == "error"
+    assert result["scan_results"][0]["error"] == "[Errno 24] Too many open files"
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        TCPScanner(backend="raw")
+
+
+def test_scan_async_timeout_is_closed(monkeypatch):
+    async def never_connects(self, sock, address):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(BaseSelectorEventLoop, "sock_connect", never_connects)
+    result = TCPScanner(timeout=0.05, backend="asyncio").scan("127.0.0.1", "80-80")
+
+    assert_single_port(result, 80, "closed")
+
+
+@patch("scanner.core.tcp.socket.socket")
+@patch("scanner.core.tcp.socket.getaddrinfo")
+def test_scan_unresolvable_host(mock_getaddrinfo, mock_socket_class):
+    mock_getaddrinfo.side_effect = socket.gaierror("Name or service not known")
+
+    scanner = TCPScanner()
+    with pytest.raises(HostResolutionError):
+        scanner.scan("does-not-exist.invalid", "1-1000")
+
+    mock_socket_class.assert_not_called()
+
+
+@patch("scanner.core.tcp.socket.getservbyport")
+def test_lookup_service_cached(mock_getservbyport):
+    mock_getservbyport.return_value = "http"
+    _service_name.cache_clear()
+
+    scanner = TCPScanner()
+    assert scanner._lookup_service(80) == "http"
+    assert scanner._lookup_service(80) == "http"
+
+    mock_getservbyport.assert_called_once_with(80)
+    _service_name.cache_clear()
+
+
+# WSAEWOULDBLOCK is what Windows returns for a pending non-blocking connect
+@pytest.mark.parametrize("pending", [errno.EINPROGRESS, 10035])
+def test_scan_pending_connect_completes(monkeypatch, pending):
+    sock = PendingSocket(pending)
+    monkeypatch.setattr("scanner.core.tcp.socket.socket", lambda *args: sock)
+
+    result = TCPScanner(timeout=1.0).scan("127.0.0.1", "80-80")
+
+    assert_single_port(result, 80, "open")
+    assert sock.closes == 1
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_scan_against_loopback(backend):
+    # Real connects, so every backend must agree on the same statuses
+    with socket.socket() as listener, socket.socket() as unused:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        # Bound but not listening, so the connect is refused
+        unused.bind(("127.0.0.1", 0))
+        open_port = listener.getsockname()[1]
+        closed_port = unused.getsockname()[1]
+
+        scanner = TCPScanner(timeout=1.0, backend=backend)
+        result = scanner.scan("127.0.0.1", [open_port, closed_port])
+
+    statuses = {entry["port"]: entry["status"] for entry in result["scan_results"]}
+    assert statuses == {open_port: "open", closed_port: "closed"}
+    assert result["open_ports"] == [open_port]
@@ -1,35 +1,93 @@
-import pytest
-
-from scanner.cli.parser import CLIValidationError, validate_host, validate_timeout
-from scanner.exceptions import PortRangeError
-from scanner.utils.validators import parse_port_range
-
-
-@pytest.mark.parametrize(
-    "ports,expected", [("22-22", (22, 22)), ("1-65535", (1, 65535))]
-)
-def test_validate_port_range_ok(ports, expected):
-    assert parse_port_range(ports) == expected
-
-
-@pytest.mark.parametrize("ports", ["0-1", "22-21", "abc", "70000-80000"])
-def test_validate_port_range_error(ports):
-    with pytest.raises(PortRangeError):
-        parse_port_range(ports)
-
-
-
-@pytest.mark.parametrize("host", ["127.0.0.1", "localhost", "example.com"])
-def test_validate_host_ok(host):
-    assert validate_host(host) == host
-
-
-@pytest.mark.parametrize("tout", [0.5, 5.0, 10.0])
-def test_validate_timeout_ok(tout):
-    assert validate_timeout(tout) == tout
-
-
-@pytest.mark.parametrize("tout", [0.01, 20.0])
-def test_validate_timeout_error(tout):
-    with pytest.raises(CLIValidationError):
-        validate_timeout(tout)
+import pytest
+
+from scanner.cli.parser import CLIValidationError, validate_host, validate_timeout
+from scanner.exceptions import PortRangeError
+from scanner.utils.validators import normalize_ports, parse_port_range
+
+
+@pytest.mark.parametrize(
+    "ports,expected",
+    [("22-22", (22, 22)), ("1-65535", (1, 65535))],
+    ids=["single", "full"],
+)
+def test_validate_port_range_ok(ports, expected):
+    assert parse_port_range(ports) == expected
+
+
+@pytest.mark.parametrize(
+    "ports",
+    ["0-1", "22-21", "abc", "70000-80000", "-80", "20-", "20-80-90", "1²-3"],
+    ids=[
+        "zero-low",
+        "reversed",
+        "non-numeric",
+        "over-max",
+        "no-start",
+        "no-end",
+        "three-parts",
+        "superscript-digit",
+    ],
+)
+def test_validate_port_range_error(ports):
+    with pytest.raises(PortRangeError):
+        parse_port_range(ports)
+
+
+@pytest.mark.parametrize(
+    "host",
+    [
+        "127.0.0.1",
+        "localhost",
+        "example.com",
+        "www.my-site.co.uk",
+        "::1",
+        "2001:db8::1",
+    ],
+)
+def test_validate_host_ok(host):
+    assert validate_host(host) == host
+
+
+@pytest.mark.parametrize(
+    "host",
+    ["256.1.1.1", "01.2.3.4", "bad_host!", "-bad.com", "a..b", "10.1.1", "x" * 64],
+)
+def test_validate_host_error(host):
+    with pytest.raises(CLIValidationError):
+        validate_host(host)
+
+
+@pytest.mark.parametrize("tout", [0.5, 5.0, 10.0])
+def test_validate_timeout_ok(tout):
+    assert validate_timeout(tout) == tout
+
+
+@pytest.mark.parametrize("tout", [0.01, 20.0], ids=["too-short", "too-long"])
+def test_validate_timeout_error(tout):
+    with pytest.raises(CLIValidationError):
+        validate_timeout(tout)
+
+
+@pytest.mark.parametrize(
+    "ports,expected",
+    [
+        ("20-22", [20, 21, 22]),
+        (range(20, 23), [20, 21, 22]),
+        # Tuples list individual ports, whatever their length
+        ((22, 80), [22, 80]),
+        ((80, 22), [80, 22]),
+        ([22, 80], [22, 80]),
+        ([443, 80], [443, 80]),
+        (range(20, 30, 5), [20, 25]),
+    ],
+)
+def test_normalize_ports_ok(ports, expected):
+    assert list(normalize_ports(ports)) == expected
+
+
+@pytest.mark.parametrize(
+    "ports", ["22-21", range(0, 10), range(30, 20), (0, 10), [80, 70000]]
+)
+def test_normalize_ports_error(ports):
+    with pytest.raises(PortRangeError):
+        normalize_ports(ports)